@@ -7,6 +7,8 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 SCREEN_TITLE = "Space Invaders (Pygame Version)"
 FPS = 60
+DEBUG = False  # Print game flow messages to the console
+STARFIELD_TWINKLE_DELAY = 250  # ms between redraws of the menu starfields
 
 # Colors (Atari-style palette)
 BLACK = (0, 0, 0)
@@ -27,6 +29,7 @@ PLAYER_WIDTH = 60
 PLAYER_HEIGHT = 30
 PLAYER_SPEED = 5
 PLAYER_LIVES = 3
+PLAYER_RESPAWN_DELAY = 1000  # Milliseconds before the ship reappears after being hit
 
 # Invader settings
 INVADER_ROWS = 5
@@ -51,6 +54,7 @@ INVADER_BULLET_WIDTH = 3
 INVADER_BULLET_HEIGHT = 15
 INVADER_BULLET_SPEED = 5
 INVADER_FIRING_CHANCE = 0.01  # Chance of an invader firing each frame
+INVADER_FIRING_COOLDOWN = 600  # Minimum ms between invader shots on level 1, shorter on later levels
 
 # Barrier settings
 BARRIER_COUNT = 4
@@ -70,6 +74,7 @@ MYSTERY_SHIP_APPEAR_CHANCE = 0.001  # Chance per frame
 SCORE_INVADER_TOP_ROW = 30
 SCORE_INVADER_MIDDLE_ROW = 20
 SCORE_INVADER_BOTTOM_ROW = 10
+SCORE_CACHE_SIZE = 10  # Rendered score surfaces kept; the oldest is dropped first
 
 # Font sizes
 FONT_LARGE = 36
@@ -88,4 +93,13 @@ STATE_HALL_OF_FAME = 5  # New state for hall of fame display
 HIGH_SCORE_COUNT = 10  # Number of high scores to keep
 HIGH_SCORE_NAME_LENGTH = 5  # Max length of name
 HIGH_SCORE_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()_+-=<>?."  # Valid characters for name entry
-HIGH_SCORE_FILE = os.path.expanduser("~/.space_invaders_scores")  # Path to high score file
\ No newline at end of file
+NAME_ENTRY_REPEAT_DELAY = 250  # ms a held key waits before repeating on the name entry screen
+NAME_ENTRY_REPEAT_INTERVAL = 80  # ms between repeats of a held key
+HALL_OF_FAME_TABLE_Y = 95  # Top of the hall of fame table, where its column headers start
+HIGH_SCORE_FILE = os.path.expanduser("~/.space_invaders_scores")  # Path to high score file
+HIGH_SCORE_BUFFER_SIZE = 65536  # Read/write buffer so the score file moves in one system call
+
+# Sound settings
+SOUND_CACHE_DIR = os.path.join(  # Generated sound effects, reused across launches
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "space_invaders"
+)
\ No newline at end of file
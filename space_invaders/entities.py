@@ -1,20 +1,57 @@
 #!/usr/bin/env python3
 import pygame
 import random
+import numpy as np
 from space_invaders.constants import *
 from space_invaders.graphics import GraphicsGenerator
 
-class Player:
+_SPRITES = {}
+_SOLID_MASKS = {}
+_RNG = np.random.default_rng()
+_RANDOM_BUFFER_SIZE = 4096
+
+
+def _shared_sprite(key, create):
+    """Return the sprite shared by every entity of a kind, creating it on first use"""
+    sprite = _SPRITES.get(key)
+    if sprite is None:
+        # The generator already matches the display pixel format; RLE-encode the sprite
+        # too so transparent runs are skipped rather than blended
+        sprite = create()
+        if pygame.display.get_surface() is not None:
+            sprite.set_alpha(255, pygame.RLEACCEL)
+        _SPRITES[key] = sprite
+    return sprite
+
+
+def _solid_mask(size):
+    """Return a shared, fully set collision mask of the given size"""
+    mask = _SOLID_MASKS.get(size)
+    if mask is None:
+        mask = _SOLID_MASKS[size] = pygame.Mask(size, fill=True)
+    return mask
+
+
+def _step_invaders(xs, ys, alive, dx, dy, left, right, width):
+    """Shift the formation by (dx, dy); return True instead if a live invader would leave the area"""
+    live_xs = xs[alive]
+    if live_xs.size and (live_xs.min() + dx < left or live_xs.max() + dx + width > right):
+        return True
+    xs += dx
+    ys += dy
+    return False
+
+
+class Player(pygame.sprite.DirtySprite):
     """The player-controlled ship at the bottom of the screen"""
     
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        super().__init__()
         self.width = PLAYER_WIDTH
         self.height = PLAYER_HEIGHT
         self.speed = PLAYER_SPEED
         self.lives = PLAYER_LIVES
-        self.sprite = GraphicsGenerator.create_player_ship()
+        self.image = _shared_sprite("player", GraphicsGenerator.create_player_ship)
         self.rect = pygame.Rect(x, y, self.width, self.height)
         self.is_alive = True
         self.last_shot_time = 0
@@ -24,7 +61,7 @@ class Player:
         if not self.is_alive:
             return
             
-        new_x = self.x + (direction * self.speed)
+        new_x = self.rect.x + (direction * self.speed)
         
         # Check boundaries
         if new_x < game_area_rect.left:
@@ -32,8 +69,9 @@ class Player:
         elif new_x + self.width > game_area_rect.right:
             new_x = game_area_rect.right - self.width
         
-        self.x = new_x
-        self.rect.x = new_x
+        if new_x != self.rect.x:
+            self.rect.x = new_x
+            self.dirty = 1
         
     def can_shoot(self, current_time):
         """Check if player can shoot based on cooldown"""
@@ -42,47 +80,46 @@ class Player:
     def shoot(self, current_time):
         """Create a bullet at the player's position"""
         self.last_shot_time = current_time
-        bullet_x = self.x + (self.width // 2) - (PLAYER_BULLET_WIDTH // 2)
-        bullet_y = self.y - PLAYER_BULLET_HEIGHT
+        bullet_x = self.rect.centerx - (PLAYER_BULLET_WIDTH // 2)
+        bullet_y = self.rect.y - PLAYER_BULLET_HEIGHT
         return PlayerBullet(bullet_x, bullet_y)
     
     def hit(self):
         """Handle player being hit"""
         self.is_alive = False
+        self.visible = 0
         self.lives -= 1
     
     def reset_position(self, x, y):
         """Reset player to the initial position"""
-        self.x = x
-        self.y = y
-        self.rect.x = x
-        self.rect.y = y
+        self.rect.topleft = (x, y)
         self.is_alive = True
-    
-    def draw(self, surface):
-        """Draw the player on the screen"""
-        if self.is_alive:
-            surface.blit(self.sprite, (self.x, self.y))
+        self.visible = 1
             
     def get_collision_rect(self):
         """Return rectangle for collision detection"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        if self.is_alive:
+            return self.rect
+        return None
 
 
-class Invader:
+class Invader(pygame.sprite.DirtySprite):
     """An alien invader"""
     
-    def __init__(self, x, y, invader_type, row, col):
-        self.x = x
-        self.y = y
+    def __init__(self, x, y, invader_type, row, col, index=0, formation=None):
+        super().__init__()
         self.width = INVADER_WIDTH
         self.height = INVADER_HEIGHT
         self.type = invader_type  # 0, 1, or 2 for different types/rows
         self.row = row
         self.col = col
-        self.sprite = GraphicsGenerator.create_invader(invader_type)
-        self.sprite_alt = GraphicsGenerator.create_alternate_frame(self.sprite)
-        self.current_sprite = self.sprite
+        self.index = index  # Slot in the InvaderGroup position arrays
+        self.formation = formation  # Owning InvaderGroup, which holds the shared animation frame
+        self.sprite = _shared_sprite(("invader", invader_type),
+                                     lambda: GraphicsGenerator.create_invader(invader_type))
+        self.sprite_alt = _shared_sprite(("invader_alt", invader_type),
+                                         lambda: GraphicsGenerator.create_alternate_frame(self.sprite))
+        self._frames = (self.sprite, self.sprite_alt)
         self.rect = pygame.Rect(x, y, self.width, self.height)
         self.is_alive = True
         
@@ -91,30 +128,20 @@ class Invader:
         if not self.is_alive:
             return
             
-        self.x += dx
-        self.y += dy
-        self.rect.x = self.x
-        self.rect.y = self.y
+        self.rect.move_ip(dx, dy)
+        self.dirty = 1
     
-    def animate(self, frame):
-        """Toggle between animation frames"""
-        if not self.is_alive:
-            return
-            
-        if frame % 2 == 0:
-            self.current_sprite = self.sprite
-        else:
-            self.current_sprite = self.sprite_alt
-    
-    def draw(self, surface):
-        """Draw the invader on the screen"""
-        if self.is_alive:
-            surface.blit(self.current_sprite, (self.x, self.y))
+    @property
+    def image(self):
+        """Current animation frame, shared by the whole formation"""
+        if self.formation is None:
+            return self.sprite
+        return self._frames[self.formation.anim_idx]
     
     def get_collision_rect(self):
         """Return rectangle for collision detection"""
         if self.is_alive:
-            return pygame.Rect(self.x, self.y, self.width, self.height)
+            return self.rect
         return None
     
     def get_points(self):
@@ -131,30 +158,59 @@ class InvaderGroup:
     """Manages a group of invaders"""
     
     def __init__(self):
-        self.invaders = []
+        self.invaders = []  # Every slot in grid order, dead or alive
+        self.alive_invaders = []  # Only the invaders still in play
         self.speed = INVADER_MOVE_SPEED_H
         self.direction = 1  # 1 for right, -1 for left
         self.move_down = False
         self.frame = 0
+        self.anim_idx = 0  # Animation frame every invader draws, set once per move
         self.last_move_time = 0
         self.move_delay = 1000  # Start with a delay of 1000ms
         self.invaders_killed = 0
         self.total_invaders = INVADER_ROWS * INVADERS_PER_ROW
         
+        # Structure-of-arrays copy of the formation for bulk edge/position tests
+        self.xs = np.zeros(self.total_invaders, np.int32)
+        self.ys = np.zeros(self.total_invaders, np.int32)
+        self.alive = np.zeros(self.total_invaders, bool)
+        self.bottom_of_col = [None] * INVADERS_PER_ROW  # Lowest live invader per column
+        self.max_y = 0  # Top edge of the lowest live row
+        
+        # Grid pitch; xs[0]/ys[0] are the grid origin since dead slots keep moving with the formation
+        self.col_step = INVADER_WIDTH + INVADER_H_SPACING
+        self.row_step = INVADER_HEIGHT + INVADER_V_SPACING
+        
+        # Uniform samples drawn in bulk so the per-frame firing roll is just an index
+        self._rbuf = _RNG.random(_RANDOM_BUFFER_SIZE)
+        self._ridx = 0
+        
     def create_invaders(self):
         """Create the initial formation of invaders"""
         self.invaders = []
         
         start_x = GAME_AREA_MARGIN_X + INVADER_H_PADDING
         start_y = GAME_AREA_MARGIN_Y + INVADER_V_PADDING
+        step_x = self.col_step
+        step_y = self.row_step
+        invaders = self.invaders
+        xs, ys = self.xs, self.ys
         
         for row in range(INVADER_ROWS):
             invader_type = 0 if row == 0 else (1 if row < 3 else 2)
-            y = start_y + row * (INVADER_HEIGHT + INVADER_V_SPACING)
+            y = start_y + row * step_y
             
             for col in range(INVADERS_PER_ROW):
-                x = start_x + col * (INVADER_WIDTH + INVADER_H_SPACING)
-                self.invaders.append(Invader(x, y, invader_type, row, col))
+                x = start_x + col * step_x
+                index = len(invaders)
+                invaders.append(Invader(x, y, invader_type, row, col, index, self))
+                xs[index] = x
+                ys[index] = y
+        
+        self.alive[:] = True
+        self.alive_invaders = list(invaders)
+        self.bottom_of_col = self.invaders[-INVADERS_PER_ROW:]
+        self.max_y = int(self.ys.max())
     
     def move(self, current_time, game_area_rect):
         """Move all invaders in the current direction"""
@@ -173,71 +229,86 @@ class InvaderGroup:
             moved_down = True
             self.move_down = False
         
-        # Check if any invader would hit the edge after moving
-        need_direction_change = False
-        for invader in self.invaders:
-            if not invader.is_alive:
-                continue
-                
-            new_x = invader.x + dx
-            if (new_x < game_area_rect.left or 
-                new_x + INVADER_WIDTH > game_area_rect.right):
-                need_direction_change = True
-                break
-        
-        # If hitting edge, prepare to move down on next update
-        if need_direction_change:
+        # Move the whole formation (dead slots keep the grid intact) unless
+        # any invader would hit the edge after moving
+        if _step_invaders(self.xs, self.ys, self.alive, dx, dy,
+                          game_area_rect.left, game_area_rect.right, INVADER_WIDTH):
+            # If hitting edge, prepare to move down on next update
             self.direction *= -1  # Reverse direction
             self.move_down = True
             return False
         
-        # Move all invaders
-        for invader in self.invaders:
-            if invader.is_alive:
-                invader.move(dx, dy)
-                invader.animate(self.frame)
+        self.max_y += dy
+        self.anim_idx = self.frame & 1
+        for invader in self.alive_invaders:
+            invader.move(dx, dy)
         
         return moved_down
         
-    def invader_killed(self):
-        """Track invader deaths and increase speed"""
+    def invader_killed(self, invader):
+        """Remove an invader from play, track deaths and increase speed"""
+        invader.is_alive = False
+        invader.kill()  # Leaves the play field, which erases it on the next draw
+        self.alive[invader.index] = False
+        self.alive_invaders.remove(invader)
         self.invaders_killed += 1
         
+        # Find the new lowest row once the last invader in the current one dies
+        if invader.rect.y == self.max_y:
+            self.max_y = int(self.ys.max(initial=-INVADER_HEIGHT, where=self.alive))
+        
+        # Only the dead invader's column can have a new bottom-most shooter
+        if self.bottom_of_col[invader.col] is invader:
+            self.bottom_of_col[invader.col] = None
+            for row in range(invader.row - 1, -1, -1):
+                above = self.invaders[row * INVADERS_PER_ROW + invader.col]
+                if above.is_alive:
+                    self.bottom_of_col[invader.col] = above
+                    break
+        
         # Increase speed as invaders are killed
         remaining = self.total_invaders - self.invaders_killed
         speed_factor = 1.0 - (remaining / self.total_invaders)
         self.move_delay = max(100, 1000 - (900 * speed_factor))  # Min 100ms delay
     
+    def invader_at(self, rect):
+        """Return the first live invader overlapping rect, testing only the grid cells it covers"""
+        origin_x = int(self.xs[0])
+        origin_y = int(self.ys[0])
+        first_col = max(0, (rect.left - origin_x) // self.col_step)
+        last_col = min(INVADERS_PER_ROW - 1, (rect.right - 1 - origin_x) // self.col_step)
+        first_row = max(0, (rect.top - origin_y) // self.row_step)
+        last_row = min(INVADER_ROWS - 1, (rect.bottom - 1 - origin_y) // self.row_step)
+        
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                invader = self.invaders[row * INVADERS_PER_ROW + col]
+                if invader.is_alive and invader.rect.colliderect(rect):
+                    return invader
+        return None
+    
     def any_invader_at_bottom(self, bottom_y):
         """Check if any invader has reached the bottom"""
-        for invader in self.invaders:
-            if invader.is_alive and invader.y + invader.height >= bottom_y:
-                return True
-        return False
+        return self.max_y + INVADER_HEIGHT >= bottom_y
     
-    def draw(self, surface):
-        """Draw all invaders"""
-        for invader in self.invaders:
-            invader.draw(surface)
+    def _rand(self):
+        """Return the next pre-drawn uniform sample in [0, 1)"""
+        r = self._rbuf[self._ridx]
+        self._ridx += 1
+        if self._ridx == _RANDOM_BUFFER_SIZE:
+            self._rbuf = _RNG.random(_RANDOM_BUFFER_SIZE)
+            self._ridx = 0
+        return r
     
     def get_random_shooter(self):
         """Select a random invader to shoot"""
-        if random.random() > INVADER_FIRING_CHANCE:
+        if self._rand() > INVADER_FIRING_CHANCE:
             return None
             
-        # Get the bottom-most invader in each column
-        bottom_invaders = {}
-        for invader in self.invaders:
-            if not invader.is_alive:
-                continue
-                
-            col = invader.col
-            if col not in bottom_invaders or invader.y > bottom_invaders[col].y:
-                bottom_invaders[col] = invader
-        
-        if bottom_invaders:
-            shooter = random.choice(list(bottom_invaders.values()))
-            return shooter
+        # Only the bottom-most invader in each column can shoot
+        candidates = [invader for invader in self.bottom_of_col if invader is not None]
+        if candidates:
+            return candidates[int(self._rand() * len(candidates))]
         
         return None
     
@@ -246,47 +317,47 @@ class InvaderGroup:
         return self.invaders_killed >= self.total_invaders
 
 
-class Barrier:
+class Barrier(pygame.sprite.DirtySprite):
     """A defensive barrier that can be damaged"""
     
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        super().__init__()
         self.width = BARRIER_WIDTH
         self.height = BARRIER_HEIGHT
-        self.sprite = GraphicsGenerator.create_barrier()
-        self.damage_map = {}  # Tracks damaged pieces
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        # Each barrier gets its own copy since damage erases pixels from it
+        self.image = _shared_sprite("barrier", GraphicsGenerator.create_barrier).copy()
+        self.image.set_alpha(255, pygame.RLEACCEL)  # Re-encoded only when damage erases pieces
+        self.mask = pygame.mask.from_surface(self.image)  # Pixels that can still stop a bullet
+        # Damage level of each 5x5 piece, indexed [piece_x, piece_y]
+        self.damage_grid = np.zeros((self.width // 5, self.height // 5), np.uint8)
         
     def check_collision(self, rect):
         """Check if a bullet collided with an undamaged part of the barrier"""
         # Convert rect to barrier-local coordinates
-        local_x = rect.x - self.x
-        local_y = rect.y - self.y
+        local_x = rect.x - self.rect.x
+        local_y = rect.y - self.rect.y
         
         # Don't check outside barrier bounds
         if (local_x < 0 or local_x >= self.width or 
             local_y < 0 or local_y >= self.height):
             return False
         
-        # Check if this section is already fully damaged
+        # Damaged pieces can't stop a bullet, so a bullet over nothing else passes straight through
         piece_size = 5
-        for y in range(local_y, min(local_y + rect.height, self.height), piece_size):
-            for x in range(local_x, min(local_x + rect.width, self.width), piece_size):
-                # Get the pixel at this position
-                piece_key = (x // piece_size, y // piece_size)
-                if piece_key not in self.damage_map:
-                    pixel_pos = (self.x + x, self.y + y)
-                    # Check if there's a non-transparent pixel at this position
-                    if self.sprite.get_at((x, y))[3] > 0:  # Alpha > 0 means not transparent
-                        return True
-        
-        return False
+        covered = self.damage_grid[local_x // piece_size:(local_x + rect.width - 1) // piece_size + 1,
+                                   local_y // piece_size:(local_y + rect.height - 1) // piece_size + 1]
+        if covered.all():
+            return False
+        
+        # Any overlap between the bullet and the remaining solid pixels is a hit
+        return self.mask.overlap(_solid_mask(rect.size), (local_x, local_y)) is not None
     
     def damage(self, rect):
         """Damage the barrier where the bullet hit"""
         # Convert rect to barrier-local coordinates
-        local_x = rect.x - self.x
-        local_y = rect.y - self.y
+        local_x = rect.x - self.rect.x
+        local_y = rect.y - self.rect.y
         
         # Don't damage outside barrier bounds
         if (local_x < 0 or local_x >= self.width or 
@@ -302,51 +373,51 @@ class Barrier:
         center_piece_x = center_x // piece_size
         center_piece_y = center_y // piece_size
         
-        for dy in range(-damage_radius, damage_radius + 1):
-            for dx in range(-damage_radius, damage_radius + 1):
-                piece_x = center_piece_x + dx
-                piece_y = center_piece_y + dy
-                
-                # Skip if outside barrier
-                if (piece_x < 0 or piece_x >= self.width // piece_size or
-                    piece_y < 0 or piece_y >= self.height // piece_size):
-                    continue
-                
-                piece_key = (piece_x, piece_y)
-                
-                # Damage the piece if it's not already fully damaged
-                damage_level = self.damage_map.get(piece_key, 0)
-                if damage_level < BARRIER_DAMAGE_LEVELS:
-                    self.damage_map[piece_key] = damage_level + 1
-                
-                # Clear the piece from the sprite if fully damaged
-                if self.damage_map[piece_key] >= BARRIER_DAMAGE_LEVELS:
-                    # Create a small transparent rect to "erase" the damaged piece
-                    erase_rect = pygame.Rect(
-                        piece_x * piece_size, piece_y * piece_size, 
-                        piece_size, piece_size
-                    )
-                    self.sprite.fill((0, 0, 0, 0), erase_rect)
-    
-    def draw(self, surface):
-        """Draw the barrier with damage"""
-        surface.blit(self.sprite, (self.x, self.y))
+        # Damage every piece within the radius in one slice, clipped to the barrier
+        x0 = max(0, center_piece_x - damage_radius)
+        y0 = max(0, center_piece_y - damage_radius)
+        area = self.damage_grid[x0:center_piece_x + damage_radius + 1,
+                                y0:center_piece_y + damage_radius + 1]
+        intact = area < BARRIER_DAMAGE_LEVELS
+        np.minimum(area + 1, BARRIER_DAMAGE_LEVELS, out=area)
+        
+        # A damaged piece no longer stops bullets, even before it is fully erased
+        damaged_rect = pygame.Rect(x0 * piece_size, y0 * piece_size,
+                                   area.shape[0] * piece_size, area.shape[1] * piece_size)
+        self.mask.erase(_solid_mask(damaged_rect.size), damaged_rect.topleft)
+        
+        # Clear pieces that just became fully damaged from the sprite
+        destroyed = np.argwhere(intact & (area >= BARRIER_DAMAGE_LEVELS)).tolist()
+        if not destroyed:
+            return
+        
+        # One lock for all the fills, so the RLE surface is decoded and re-encoded once
+        self.image.lock()
+        for piece_x, piece_y in destroyed:
+            # Create a small transparent rect to "erase" the damaged piece
+            erase_rect = pygame.Rect(
+                (x0 + piece_x) * piece_size, (y0 + piece_y) * piece_size,
+                piece_size, piece_size
+            )
+            self.image.fill((0, 0, 0, 0), erase_rect)
+        self.image.unlock()
+        self.dirty = 1
 
 
-class MysteryShip:
+class MysteryShip(pygame.sprite.DirtySprite):
     """The special mystery ship that appears at the top periodically"""
     
     def __init__(self):
+        super().__init__()
         self.width = MYSTERY_SHIP_WIDTH
         self.height = MYSTERY_SHIP_HEIGHT
         self.speed = MYSTERY_SHIP_SPEED
-        self.sprite = GraphicsGenerator.create_mystery_ship()
+        self.image = _shared_sprite("mystery_ship", GraphicsGenerator.create_mystery_ship)
         self.points = MYSTERY_SHIP_POINTS
         self.is_active = False
+        self.visible = 0
         self.direction = 1  # 1 for right to left, -1 for left to right
-        self.x = 0
-        self.y = GAME_AREA_MARGIN_Y + 20  # Near the top
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect = pygame.Rect(0, GAME_AREA_MARGIN_Y + 20, self.width, self.height)  # Near the top
         
     def activate(self, screen_width):
         """Start the mystery ship moving across the screen"""
@@ -354,39 +425,34 @@ class MysteryShip:
             return
             
         self.is_active = True
+        self.visible = 1
         self.direction = random.choice([-1, 1])
         
         if self.direction > 0:
             # Moving right, start at left edge
-            self.x = -self.width
+            self.rect.x = -self.width
         else:
             # Moving left, start at right edge
-            self.x = screen_width
-            
-        self.rect.x = self.x
-        self.rect.y = self.y
+            self.rect.x = screen_width
     
     def update(self, screen_width):
         """Update the mystery ship position"""
         if not self.is_active:
             return
             
-        self.x += self.direction * self.speed
-        self.rect.x = self.x
+        self.rect.x += self.direction * self.speed
+        self.dirty = 1
         
         # Deactivate if we've gone off screen
-        if ((self.direction > 0 and self.x > screen_width) or
-            (self.direction < 0 and self.x < -self.width)):
+        if ((self.direction > 0 and self.rect.x > screen_width) or
+            (self.direction < 0 and self.rect.x < -self.width)):
             self.is_active = False
-    
-    def draw(self, surface):
-        """Draw the mystery ship"""
-        if self.is_active:
-            surface.blit(self.sprite, (self.x, self.y))
+            self.visible = 0
     
     def hit(self):
         """Handle being hit by player bullet"""
         self.is_active = False
+        self.visible = 0
         # Return random point value
         return random.choice(self.points)
     
@@ -397,12 +463,11 @@ class MysteryShip:
         return None
 
 
-class Bullet:
+class Bullet(pygame.sprite.DirtySprite):
     """Base class for bullets"""
     
     def __init__(self, x, y, width, height, speed):
-        self.x = x
-        self.y = y
+        super().__init__()
         self.width = width
         self.height = height
         self.speed = speed
@@ -413,9 +478,10 @@ class Bullet:
         """Update bullet position"""
         pass
     
-    def draw(self, surface):
-        """Draw the bullet"""
-        pass
+    def kill(self):
+        """Take the bullet out of play and off the screen"""
+        self.active = False
+        super().kill()
     
     def get_collision_rect(self):
         """Return rectangle for collision detection"""
@@ -429,24 +495,21 @@ class PlayerBullet(Bullet):
     
     def __init__(self, x, y):
         super().__init__(x, y, PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT, PLAYER_BULLET_SPEED)
-        self.sprite = GraphicsGenerator.create_bullet(0)  # 0 for player bullet
+        self.image = _shared_sprite(("bullet", 0), lambda: GraphicsGenerator.create_bullet(0))  # 0 for player bullet
     
-    def update(self):
+    def update(self, _speed=PLAYER_BULLET_SPEED):
         """Move bullet upwards"""
         if not self.active:
             return
-            
-        self.y -= self.speed
-        self.rect.y = self.y
+        
+        # Speed is bound at definition time so the per-frame step is all local reads
+        rect = self.rect
+        rect.y -= _speed
+        self.dirty = 1
         
         # Deactivate if it goes off the top of the screen
-        if self.y < 0:
-            self.active = False
-    
-    def draw(self, surface):
-        """Draw player bullet"""
-        if self.active:
-            surface.blit(self.sprite, (self.x, self.y))
+        if rect.y < 0:
+            self.kill()
 
 
 class InvaderBullet(Bullet):
@@ -454,21 +517,28 @@ class InvaderBullet(Bullet):
     
     def __init__(self, x, y):
         super().__init__(x, y, INVADER_BULLET_WIDTH, INVADER_BULLET_HEIGHT, INVADER_BULLET_SPEED)
-        self.sprite = GraphicsGenerator.create_bullet(1)  # 1 for invader bullet
+        self.image = _shared_sprite(("bullet", 1), lambda: GraphicsGenerator.create_bullet(1))  # 1 for invader bullet
     
-    def update(self):
+    def update(self, _speed=INVADER_BULLET_SPEED, _bottom=SCREEN_HEIGHT):
         """Move bullet downwards"""
         if not self.active:
             return
-            
-        self.y += self.speed
-        self.rect.y = self.y
+        
+        rect = self.rect
+        rect.y += _speed
+        self.dirty = 1
         
         # Deactivate if it goes off the bottom of the screen
-        if self.y > SCREEN_HEIGHT:
-            self.active = False
-    
-    def draw(self, surface):
-        """Draw invader bullet"""
-        if self.active:
-            surface.blit(self.sprite, (self.x, self.y))
\ No newline at end of file
+        if rect.y > _bottom:
+            self.kill()
+
+
+class Explosion(pygame.sprite.DirtySprite):
+    """A short-lived explosion effect drawn above the other sprites"""
+    
+    def __init__(self, x, y, image, created):
+        super().__init__()
+        self._layer = 1
+        self.image = image
+        self.rect = image.get_rect(topleft=(x, y))
+        self.created = created  # Time in ms the explosion appeared
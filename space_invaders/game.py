@@ -1,29 +1,42 @@
 #!/usr/bin/env python3
 import os
 import json
+import bisect
+from collections import deque
 import math
 import pygame
 import random
 import time
 from space_invaders.constants import *
-from space_invaders.entities import Player, InvaderGroup, Barrier, MysteryShip, PlayerBullet, InvaderBullet
+from space_invaders.entities import Player, InvaderGroup, Barrier, MysteryShip, InvaderBullet, Explosion
 from space_invaders.graphics import GraphicsGenerator
 from space_invaders.sound import SoundGenerator
 
+# Use a C JSON codec for the high score file when one is installed
+try:
+    import orjson as fast_json
+except ImportError:
+    try:
+        import ujson as fast_json
+    except ImportError:
+        fast_json = json
+
 class HighScoreManager:
     """Manages the high score list and file operations"""
 
     def __init__(self):
         """Initialize the high score manager"""
         self.high_scores = []
+        self.min_score = 0  # Lowest score on the (full) list, the bar a new score must beat
         self.load_scores()
 
     def load_scores(self):
         """Load high scores from file"""
         try:
             if os.path.exists(HIGH_SCORE_FILE):
-                with open(HIGH_SCORE_FILE, 'r') as file:
-                    self.high_scores = json.load(file)
+                with open(HIGH_SCORE_FILE, 'rb', buffering=HIGH_SCORE_BUFFER_SIZE) as file:
+                    self.high_scores = fast_json.loads(file.read())
+                self.high_scores.sort(key=lambda x: x["score"], reverse=True)
             else:
                 # Create default high scores if file doesn't exist
                 self.high_scores = [
@@ -42,12 +55,20 @@ class HighScoreManager:
         except Exception as e:
             print(f"Error loading high scores: {e}")
             self.high_scores = []
+        self.update_min_score()
+
+    def update_min_score(self):
+        """Cache the lowest listed score; the list is kept sorted highest first"""
+        self.min_score = self.high_scores[-1]["score"] if self.high_scores else 0
 
     def save_scores(self):
         """Save high scores to file"""
         try:
-            with open(HIGH_SCORE_FILE, 'w') as file:
-                json.dump(self.high_scores, file)
+            data = fast_json.dumps(self.high_scores)
+            if isinstance(data, str):
+                data = data.encode()  # orjson returns bytes, json and ujson return str
+            with open(HIGH_SCORE_FILE, 'wb', buffering=HIGH_SCORE_BUFFER_SIZE) as file:
+                file.write(data)
         except Exception as e:
             print(f"Error saving high scores: {e}")
 
@@ -55,16 +76,17 @@ class HighScoreManager:
         """Check if a score qualifies for the high score list"""
         if len(self.high_scores) < HIGH_SCORE_COUNT:
             return True
-        return score > min(entry["score"] for entry in self.high_scores)
+        return score > self.min_score
 
     def add_score(self, name, score, level):
         """Add a new high score entry"""
         new_entry = {"name": name, "score": score, "level": level}
-        self.high_scores.append(new_entry)
-        # Sort by score (highest first)
-        self.high_scores.sort(key=lambda x: x["score"], reverse=True)
+        # Insert after any equal scores, keeping the list sorted highest first
+        keys = [-entry["score"] for entry in self.high_scores]
+        self.high_scores.insert(bisect.bisect_right(keys, -score), new_entry)
         # Keep only top scores
         self.high_scores = self.high_scores[:HIGH_SCORE_COUNT]
+        self.update_min_score()
         self.save_scores()
 
     def get_high_scores(self):
@@ -86,6 +108,7 @@ class SpaceInvadersGame:
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(SCREEN_TITLE)
+        GraphicsGenerator.load_fonts(FONT_SMALL, FONT_MEDIUM, FONT_LARGE)
         self.clock = pygame.time.Clock()
         self.game_area = pygame.Rect(
             GAME_AREA_MARGIN_X, GAME_AREA_MARGIN_Y,
@@ -94,9 +117,32 @@ class SpaceInvadersGame:
         self.running = True
         self.game_state = STATE_ATTRACT
 
-        # Create sound generator and generate sounds
+        # Static backdrop (black with the game border) that sprites are cleared to
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        pygame.draw.rect(self.background, WHITE, self.game_area, 1)
+
+        # HUD strips above and below the play field
+        self.score_area = pygame.Rect(0, 0, SCREEN_WIDTH, self.game_area.top)
+        self.status_area = pygame.Rect(0, self.game_area.bottom, SCREEN_WIDTH, SCREEN_HEIGHT - self.game_area.bottom)
+        self.playfield_clip = pygame.Rect(0, self.score_area.bottom, SCREEN_WIDTH,
+                                          self.status_area.top - self.score_area.bottom)
+
+        # Fixed areas of the menu screens, allocated once rather than every frame
+        self.screen_border = pygame.Rect(10, 10, SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20)
+        self.selection_box = pygame.Rect(0, 0, 40, 45)  # Moved to the selected name character
+        self.hall_of_fame_keys_area = pygame.Rect(0, SCREEN_HEIGHT - 70, SCREEN_WIDTH, 70)
+        self.banner_area = pygame.Rect(0, SCREEN_HEIGHT - 30, SCREEN_WIDTH, 0)  # Height set by the banner
+
+        # What was on screen after the last draw, to decide between a full and a dirty-rect redraw
+        self.last_drawn_state = None
+        self.last_drawn_hud = None
+        self.last_entry_view = None
+        self.entry_header = None  # (pulse size, rect) of the header last drawn on the entry screen
+        self.last_hall_of_fame_view = None
+
+        # Create sound generator, which loads or generates every sound
         self.sound_generator = SoundGenerator()
-        self.sound_generator.generate_all_sounds()
 
         # Initialize high score manager
         self.high_score_manager = HighScoreManager()
@@ -115,10 +161,15 @@ class SpaceInvadersGame:
         self.level = 1
         self.last_invader_movement_sound = 0
         self.invader_movement_sound_index = 0
-        self.explosion_sprites = []
-        self.explosion_timers = []
+        self.explosions = deque()  # Live explosions, oldest first since they all last as long
+        # A few pre-generated explosion sprites to pick from, instead of drawing one per hit
+        self.explosion_variants = tuple(
+            GraphicsGenerator.create_explosion(40) for _ in range(4)
+        )
         self.game_over_timer = 0
         self.digit_sprites = GraphicsGenerator.create_digit_sprites()
+        self.score_cache = {}  # Composed digit surfaces keyed by score value
+        self.starfields = {}  # Star count -> (time drawn, star overlay surface)
 
         # Level transition variables
         self.transition_timer = 0
@@ -128,13 +179,23 @@ class SpaceInvadersGame:
         self.player_name = ["A"] * HIGH_SCORE_NAME_LENGTH  # Default name
         self.current_char = 0  # Current character position
         self.char_index = 0    # Index in the HIGH_SCORE_CHARS
-        self.name_entry_cooldown = 0
-        self.name_entry_delay = 150  # ms between character changes
+        total_width = HIGH_SCORE_NAME_LENGTH * 40  # 40px per character with spacing
+        self.name_start_x = SCREEN_WIDTH // 2 - total_width // 2  # Left edge of the name on screen
+        # Every selectable character pre-rendered, for the name itself and the grey hints around it
+        self.name_char_surfaces = {
+            color: {char: GraphicsGenerator.create_text_surface(char, FONT_LARGE, color) for char in HIGH_SCORE_CHARS}
+            for color in (WHITE, YELLOW)
+        }
+        self.name_hint_surfaces = [
+            GraphicsGenerator.create_text_surface(char, FONT_SMALL, (100, 100, 100)) for char in HIGH_SCORE_CHARS
+        ]
 
         # Hall of Fame variables
         self.scroll_position = 0
         self.scroll_timer = 0
         self.scroll_speed = 1  # pixels per frame
+        self.hall_of_fame_text = {}  # Static labels, rendered when the screen is entered
+        self.hall_of_fame_table = None  # Column headers and score rows composed into one surface
 
     def init_game_objects(self):
         """Initialize or reset all game objects"""
@@ -142,6 +203,7 @@ class SpaceInvadersGame:
         player_x = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
         player_y = SCREEN_HEIGHT - GAME_AREA_MARGIN_Y - PLAYER_HEIGHT - 20
         self.player = Player(player_x, player_y)
+        self.life_icon = pygame.transform.scale(self.player.image, (PLAYER_WIDTH // 2, PLAYER_HEIGHT // 2))
 
         # Create invader group
         self.invader_group = InvaderGroup()
@@ -154,6 +216,7 @@ class SpaceInvadersGame:
             barrier_x = GAME_AREA_MARGIN_X + barrier_spacing * (i + 1) - (BARRIER_WIDTH // 2)
             barrier_y = BARRIER_Y_POS
             self.barriers.append(Barrier(barrier_x, barrier_y))
+        self.barrier_rects = [barrier.rect for barrier in self.barriers]
 
         # Create mystery ship
         self.mystery_ship = MysteryShip()
@@ -162,7 +225,16 @@ class SpaceInvadersGame:
         self.player_bullets = []
         self.invader_bullets = []
 
+        # Every sprite on the play field, redrawn only where something changed
+        self.playfield = pygame.sprite.LayeredDirty(
+            self.player, self.invader_group.invaders, self.barriers, self.mystery_ship
+        )
+        self.playfield.clear(self.screen, self.background)
+        self.playfield.set_clip(self.playfield_clip)
+
         # Game timing
+        self.respawn_time = None  # When the player ship reappears after being hit
+        self.last_invader_shot_time = 0
         self.last_mystery_ship_time = pygame.time.get_ticks()
         self.mystery_ship_delay = random.randint(15000, 30000)  # 15-30 seconds
 
@@ -202,17 +274,15 @@ class SpaceInvadersGame:
                 elif event.key == pygame.K_q:
                     # Reset high scores in hall of fame screen
                     if self.game_state == STATE_HALL_OF_FAME:
-                        self.high_score_manager.reset_scores()
+                        self.reset_high_scores()
 
                 # High score name entry navigation
                 elif self.game_state == STATE_HIGH_SCORE_ENTRY:
                     if event.key == pygame.K_LEFT:
                         self.current_char = (self.current_char - 1) % HIGH_SCORE_NAME_LENGTH
-                        self.name_entry_cooldown = pygame.time.get_ticks()
 
                     elif event.key == pygame.K_RIGHT:
                         self.current_char = (self.current_char + 1) % HIGH_SCORE_NAME_LENGTH
-                        self.name_entry_cooldown = pygame.time.get_ticks()
 
                     elif event.key == pygame.K_UP:
                         # Find the current character in the character list
@@ -224,7 +294,6 @@ class SpaceInvadersGame:
                         # Move to previous character
                         self.char_index = (self.char_index - 1) % len(HIGH_SCORE_CHARS)
                         self.player_name[self.current_char] = HIGH_SCORE_CHARS[self.char_index]
-                        self.name_entry_cooldown = pygame.time.get_ticks()
 
                     elif event.key == pygame.K_DOWN:
                         # Find the current character in the character list
@@ -236,12 +305,10 @@ class SpaceInvadersGame:
                         # Move to next character
                         self.char_index = (self.char_index + 1) % len(HIGH_SCORE_CHARS)
                         self.player_name[self.current_char] = HIGH_SCORE_CHARS[self.char_index]
-                        self.name_entry_cooldown = pygame.time.get_ticks()
 
         # Check continuous key presses for gameplay
         if self.game_state == STATE_PLAYING and self.player.is_alive:
             keys = pygame.key.get_pressed()
-
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
                 self.player.move(-1, self.game_area)
 
@@ -260,6 +327,7 @@ class SpaceInvadersGame:
             # Create a new bullet
             bullet = self.player.shoot(current_time)
             self.player_bullets.append(bullet)
+            self.playfield.add(bullet)
 
             # Play sound
             self.sound_generator.play_sound("player_shoot")
@@ -275,76 +343,82 @@ class SpaceInvadersGame:
                 self.complete_level_transition()
 
         elif self.game_state == STATE_PLAYING:
-            # Update player bullets
-            for bullet in self.player_bullets[:]:
-                bullet.update()
-                if not bullet.active:
-                    self.player_bullets.remove(bullet)
-
-            # Update invader bullets
-            for bullet in self.invader_bullets[:]:
-                bullet.update()
-                if not bullet.active:
-                    self.invader_bullets.remove(bullet)
+            # Bound once for the many uses below
+            invader_group = self.invader_group
+            mystery_ship = self.mystery_ship
+            play_sound = self.sound_generator.play_sound
+
+            # Bring the player back once the respawn delay has passed
+            if self.respawn_time is not None and current_time >= self.respawn_time:
+                self.respawn_time = None
+                player_x = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
+                player_y = SCREEN_HEIGHT - GAME_AREA_MARGIN_Y - PLAYER_HEIGHT - 20
+                self.player.reset_position(player_x, player_y)
+
+            # Move player bullets, then drop the ones that left the screen
+            if self.player_bullets:
+                for bullet in self.player_bullets:
+                    bullet.update()
+                self.player_bullets = [bullet for bullet in self.player_bullets if bullet.active]
+
+            # Move invader bullets and resolve their hits in the same pass
+            self.update_invader_bullets()
 
             # Update invader movement
-            if self.invader_group.move(current_time, self.game_area):
+            if invader_group.move(current_time, self.game_area):
                 # Play movement sound when invaders move down
-                self.sound_generator.play_sound("invader_movement")
+                play_sound("invader_movement")
                 self.last_invader_movement_sound = current_time
                 self.invader_movement_sound_index = (self.invader_movement_sound_index + 1) % 4
 
             # Check if invaders have reached the bottom
-            if self.invader_group.any_invader_at_bottom(self.player.y):
+            if invader_group.any_invader_at_bottom(self.player.rect.y):
                 self.game_over()
 
-            # Random invader shooting
-            shooter = self.invader_group.get_random_shooter()
-            if shooter and shooter.is_alive:
-                bullet_x = shooter.x + (shooter.width // 2) - (INVADER_BULLET_WIDTH // 2)
-                bullet_y = shooter.y + shooter.height
-                self.invader_bullets.append(InvaderBullet(bullet_x, bullet_y))
-                self.sound_generator.play_sound("invader_shoot")
+            # Random invader shooting, at most once per cooldown (which shrinks each level)
+            firing_cooldown = max(INVADER_FIRING_COOLDOWN // 3, INVADER_FIRING_COOLDOWN - (self.level - 1) * 50)
+            if current_time - self.last_invader_shot_time > firing_cooldown:
+                shooter = invader_group.get_random_shooter()
+                if shooter and shooter.is_alive:
+                    bullet_x = shooter.rect.centerx - (INVADER_BULLET_WIDTH // 2)
+                    bullet_y = shooter.rect.bottom
+                    bullet = InvaderBullet(bullet_x, bullet_y)
+                    self.invader_bullets.append(bullet)
+                    self.playfield.add(bullet)
+                    play_sound("invader_shoot")
+                    self.last_invader_shot_time = current_time
 
             # Mystery ship logic
-            if not self.mystery_ship.is_active:
+            if not mystery_ship.is_active:
                 if current_time - self.last_mystery_ship_time > self.mystery_ship_delay:
-                    self.mystery_ship.activate(SCREEN_WIDTH)
+                    mystery_ship.activate(SCREEN_WIDTH)
                     self.last_mystery_ship_time = current_time
                     self.mystery_ship_delay = random.randint(15000, 30000)  # 15-30 seconds
-                    self.sound_generator.play_sound("mystery_ship")
+                    play_sound("mystery_ship")
             else:
-                self.mystery_ship.update(SCREEN_WIDTH)
-                if not self.mystery_ship.is_active:
+                mystery_ship.update(SCREEN_WIDTH)
+                if not mystery_ship.is_active:
                     self.sound_generator.stop_sound("mystery_ship")
 
             # Check collisions
             self.check_collisions()
 
             # Check if all invaders are dead
-            if self.invader_group.all_dead():
+            if invader_group.all_dead():
                 self.start_level_transition()
 
-        elif self.game_state == STATE_HIGH_SCORE_ENTRY:
-            self.update_high_score_entry()
-
         elif self.game_state == STATE_HALL_OF_FAME:
             self.update_hall_of_fame()
 
-        # Update explosions (do this in all states)
-        expired_explosions = []
-        for i, timer in enumerate(self.explosion_timers):
-            if current_time - timer > 500:  # Explosion lasts 500ms
-                expired_explosions.append(i)
-
-        # Remove expired explosions from the end to avoid index shifting issues
-        for i in reversed(expired_explosions):
-            self.explosion_timers.pop(i)
-            self.explosion_sprites.pop(i)
+        # Update explosions (do this in all states); only the expired ones at the front are touched
+        explosions = self.explosions
+        while explosions and current_time - explosions[0].created > 500:  # Explosion lasts 500ms
+            explosions.popleft().kill()
 
     def start_level_transition(self):
         """Start the level transition sequence"""
-        print(f"Starting level transition from level {self.level}")
+        if DEBUG:
+            print(f"Starting level transition from level {self.level}")
         self.game_state = STATE_LEVEL_TRANSITION
         self.transition_timer = pygame.time.get_ticks()
 
@@ -352,106 +426,136 @@ class SpaceInvadersGame:
         """Complete the level transition and start the next level"""
         old_level = self.level
         self.level += 1
-        print(f"Completing level transition from {old_level} to {self.level}")
+        if DEBUG:
+            print(f"Completing level transition from {old_level} to {self.level}")
 
         # Clear bullets
-        self.player_bullets = []
-        self.invader_bullets = []
+        self.clear_bullets()
 
         # Reset invaders but make them faster
         self.invader_group = InvaderGroup()  # Create a completely new invader group
         self.invader_group.create_invaders()
+        self.playfield.add(self.invader_group.invaders)
         self.invader_group.move_delay = max(100, 1000 - (self.level * 100))  # Progressively faster
 
         # Return to playing state
         self.game_state = STATE_PLAYING
 
     def check_collisions(self):
-        """Check for collisions between game objects"""
+        """Check player bullets against the mystery ship, invaders and barriers"""
+        # Bullets that hit something are killed (marked inactive) and filtered out at the end
+        # Invader bullets are handled as they move, in update_invader_bullets
+        if not self.player_bullets:
+            return
+
+        invader_group = self.invader_group
+        play_sound = self.sound_generator.play_sound
+
         # Player bullets vs invaders
-        for bullet in self.player_bullets[:]:
+        mystery_rect = self.mystery_ship.get_collision_rect()
+        for bullet in self.player_bullets:
             if not bullet.active:
                 continue
+            bullet_rect = bullet.get_collision_rect()
 
             # Check mystery ship collision
-            mystery_rect = self.mystery_ship.get_collision_rect()
-            if mystery_rect and bullet.get_collision_rect().colliderect(mystery_rect):
+            if mystery_rect and bullet_rect.colliderect(mystery_rect):
                 points = self.mystery_ship.hit()
+                mystery_rect = None  # Destroyed, later bullets pass through
                 self.score += points
-                bullet.active = False
-                self.player_bullets.remove(bullet)
-                self.add_explosion(self.mystery_ship.x, self.mystery_ship.y)
+                bullet.kill()
+                self.add_explosion(self.mystery_ship.rect.x, self.mystery_ship.rect.y)
                 self.sound_generator.stop_sound("mystery_ship")
-                self.sound_generator.play_sound("mystery_ship_hit")
+                play_sound("mystery_ship_hit")
                 continue
 
-            # Check invader collisions
-            for invader in self.invader_group.invaders:
-                invader_rect = invader.get_collision_rect()
-                if invader_rect and bullet.get_collision_rect().colliderect(invader_rect):
-                    invader.is_alive = False
-                    self.invader_group.invader_killed()
-                    points = invader.get_points()
-                    self.score += points
-                    bullet.active = False
-                    self.player_bullets.remove(bullet)
-                    self.add_explosion(invader.x, invader.y)
-                    self.sound_generator.play_sound("invader_explosion")
-                    break
+            # Check invader collisions against the grid cells under the bullet
+            invader = invader_group.invader_at(bullet_rect)
+            if invader:
+                invader_group.invader_killed(invader)
+                points = invader.get_points()
+                self.score += points
+                bullet.kill()
+                self.add_explosion(invader.rect.x, invader.rect.y)
+                play_sound("invader_explosion")
 
         # Player bullets vs barriers
-        for bullet in self.player_bullets[:]:
+        for bullet in self.player_bullets:
             if not bullet.active:
                 continue
 
-            for barrier in self.barriers:
-                if barrier.check_collision(bullet.get_collision_rect()):
-                    barrier.damage(bullet.get_collision_rect())
-                    bullet.active = False
-                    self.player_bullets.remove(bullet)
-                    break
-
-        # Invader bullets vs player
-        if self.player.is_alive:
-            player_rect = self.player.get_collision_rect()
-            for bullet in self.invader_bullets[:]:
-                if bullet.active and bullet.get_collision_rect().colliderect(player_rect):
-                    self.player.hit()
-                    bullet.active = False
-                    self.invader_bullets.remove(bullet)
-                    self.add_explosion(self.player.x, self.player.y)
-                    self.sound_generator.play_sound("player_explosion")
-
-                    # Check if game over
-                    if self.player.lives <= 0:
-                        self.game_over()
-                    else:
-                        # Respawn player after a delay
-                        pygame.time.delay(1000)
-                        player_x = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
-                        player_y = SCREEN_HEIGHT - GAME_AREA_MARGIN_Y - PLAYER_HEIGHT - 20
-                        self.player.reset_position(player_x, player_y)
-
-                    break
-
-        # Invader bullets vs barriers
-        for bullet in self.invader_bullets[:]:
+            bullet_rect = bullet.get_collision_rect()
+            barrier = self.barrier_hit(bullet_rect)
+            if barrier:
+                barrier.damage(bullet_rect)
+                bullet.kill()
+
+        self.player_bullets = [bullet for bullet in self.player_bullets if bullet.active]
+
+    def update_invader_bullets(self):
+        """Move invader bullets and check them against the player and barriers in a single pass"""
+        if not self.invader_bullets:
+            return
+
+        player_rect = self.player.get_collision_rect()  # None while the player is down
+        remaining = []
+        for bullet in self.invader_bullets:
+            bullet.update()
             if not bullet.active:
                 continue
+            bullet_rect = bullet.get_collision_rect()
+
+            # Invader bullet vs player, at most one hit per frame
+            if player_rect and bullet_rect.colliderect(player_rect):
+                bullet.kill()
+                player_rect = None
+                self.player_hit()
+                continue
+
+            # Invader bullet vs barriers
+            barrier = self.barrier_hit(bullet_rect)
+            if barrier:
+                barrier.damage(bullet_rect)
+                bullet.kill()
+                continue
+
+            remaining.append(bullet)
+        self.invader_bullets = remaining
+
+    def player_hit(self):
+        """Handle the player being shot"""
+        self.player.hit()
+        self.add_explosion(self.player.rect.x, self.player.rect.y)
+        self.sound_generator.play_sound("player_explosion")
+
+        # Check if game over
+        if self.player.lives <= 0:
+            self.game_over()
+        else:
+            # Respawn player after a delay, without stopping the game loop
+            self.respawn_time = pygame.time.get_ticks() + PLAYER_RESPAWN_DELAY
 
-            for barrier in self.barriers:
-                if barrier.check_collision(bullet.get_collision_rect()):
-                    barrier.damage(bullet.get_collision_rect())
-                    bullet.active = False
-                    self.invader_bullets.remove(bullet)
-                    break
+    def barrier_hit(self, rect):
+        """Return the barrier whose remaining pixels the rect hits, or None"""
+        # Barriers never overlap, so the C-side rect scan finds the only candidate
+        index = rect.collidelist(self.barrier_rects)
+        if index != -1 and self.barriers[index].check_collision(rect):
+            return self.barriers[index]
+        return None
 
     def add_explosion(self, x, y):
         """Add an explosion effect at the given position"""
-        size = 40  # Size of explosion
-        explosion_sprite = GraphicsGenerator.create_explosion(size)
-        self.explosion_sprites.append((explosion_sprite, (x, y)))
-        self.explosion_timers.append(pygame.time.get_ticks())
+        current_time = pygame.time.get_ticks()
+        explosion = Explosion(x, y, random.choice(self.explosion_variants), current_time)
+        self.explosions.append(explosion)
+        self.playfield.add(explosion)
+
+    def clear_bullets(self):
+        """Remove every bullet from play"""
+        for bullet in self.player_bullets + self.invader_bullets:
+            bullet.kill()
+        self.player_bullets = []
+        self.invader_bullets = []
 
     def start_new_game(self):
         """Start a new game"""
@@ -473,7 +577,8 @@ class SpaceInvadersGame:
             self.player_name = ["A"] * HIGH_SCORE_NAME_LENGTH
             self.current_char = 0
             self.char_index = 0
-            self.name_entry_cooldown = 0
+            # Held keys repeat as KEYDOWN events while the name is being entered
+            pygame.key.set_repeat(NAME_ENTRY_REPEAT_DELAY, NAME_ENTRY_REPEAT_INTERVAL)
         else:
             # Standard game over
             self.game_state = STATE_GAME_OVER
@@ -485,19 +590,36 @@ class SpaceInvadersGame:
         self.level += 1
 
         # Clear bullets
-        self.player_bullets = []
-        self.invader_bullets = []
+        self.clear_bullets()
 
         # Reset invaders but make them faster
         self.invader_group.create_invaders()
+        self.playfield.add(self.invader_group.invaders)
         self.invader_group.move_delay = max(100, self.invader_group.move_delay - 100)
 
+    def starfield(self, count):
+        """Return an overlay of randomly placed stars, redrawn every STARFIELD_TWINKLE_DELAY ms"""
+        current_time = pygame.time.get_ticks()
+        drawn = self.starfields.get(count)
+        if drawn is None or current_time - drawn[0] >= STARFIELD_TWINKLE_DELAY:
+            surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            rand = random.random  # Far cheaper than randint; scaled and truncated to the same ranges
+            surface.lock()  # One lock for all the circles instead of one each
+            for _ in range(count):
+                x = int(rand() * (SCREEN_WIDTH + 1))
+                y = int(rand() * (SCREEN_HEIGHT + 1))
+                size = 1 + int(rand() * 2)  # Reduced max size from 3 to 2
+                pygame.draw.circle(surface, WHITE, (x, y), size)
+            surface.unlock()
+            # Black is transparent; RLE lets the blit skip straight over the empty sky
+            surface.set_colorkey(BLACK, pygame.RLEACCEL)
+            drawn = self.starfields[count] = (current_time, surface)
+        return drawn[1]
+
     def draw_score(self):
         """Draw the score and high score at the top of the screen"""
         # Draw score area background (solid black rectangle)
-        score_bg_height = 45
-        score_bg_rect = pygame.Rect(0, 0, SCREEN_WIDTH, score_bg_height)
-        pygame.draw.rect(self.screen, BLACK, score_bg_rect)
+        pygame.draw.rect(self.screen, BLACK, self.score_area)
 
         # Draw "SCORE" text - positioned at the very top
         score_text = GraphicsGenerator.create_text_surface("SCORE", FONT_SMALL)
@@ -509,24 +631,31 @@ class SpaceInvadersGame:
         self.screen.blit(high_score_text, (high_score_x, 2))
 
         # Draw actual score - just below the header
-        score_str = str(self.score).zfill(4)
         score_x = 50
         score_y = 20
-        self.draw_digits(score_str, score_x, score_y)
+        self.screen.blit(self.score_surface(self.score), (score_x, score_y))
 
         # Draw high score - just below the header
-        high_score_str = str(self.high_score).zfill(4)
-        high_score_x = SCREEN_WIDTH - 50 - (len(high_score_str) * 20)  # Slightly reduced spacing
-        self.draw_digits(high_score_str, high_score_x, score_y)
-
-    def draw_digits(self, number_str, x, y):
-        """Draw a series of digits using the custom digit sprites"""
-        digit_width = 22  # Width of each digit including spacing
-
-        for i, digit in enumerate(number_str):
-            digit_index = int(digit)
-            digit_sprite = self.digit_sprites[digit_index]
-            self.screen.blit(digit_sprite, (x + i * digit_width, y))
+        high_score_digits = len(str(self.high_score).zfill(4))
+        high_score_x = SCREEN_WIDTH - 50 - (high_score_digits * 20)  # Slightly reduced spacing
+        self.screen.blit(self.score_surface(self.high_score), (high_score_x, score_y))
+
+    def score_surface(self, value):
+        """Return the zero-padded score drawn with the digit sprites, caching the most recent values"""
+        surface = self.score_cache.get(value)
+        if surface is None:
+            number_str = str(value).zfill(4)
+            digit_width = 22  # Width of each digit including spacing
+            digit_sprite_width, digit_height = self.digit_sprites[0].get_size()
+            surface = pygame.Surface(
+                (digit_width * (len(number_str) - 1) + digit_sprite_width, digit_height), pygame.SRCALPHA
+            )
+            for i, digit in enumerate(number_str):
+                surface.blit(self.digit_sprites[int(digit)], (i * digit_width, 0))
+            surface = self.score_cache[value] = surface.convert_alpha()
+            if len(self.score_cache) > SCORE_CACHE_SIZE:
+                del self.score_cache[next(iter(self.score_cache))]  # Dicts keep insertion order, so this is the oldest
+        return surface
 
     def draw_lives(self):
         """Draw the player's remaining lives"""
@@ -534,22 +663,54 @@ class SpaceInvadersGame:
         self.screen.blit(lives_text, (50, SCREEN_HEIGHT - 40))
 
         # Draw small player ships for each life
-        ship_width = PLAYER_WIDTH // 2
-        ship_height = PLAYER_HEIGHT // 2
-        ship_sprite = pygame.transform.scale(self.player.sprite, (ship_width, ship_height))
+        ship_width = self.life_icon.get_width()
 
         for i in range(self.player.lives):
             ship_x = 120 + (i * (ship_width + 10))
             ship_y = SCREEN_HEIGHT - 40
-            self.screen.blit(ship_sprite, (ship_x, ship_y))
+            self.screen.blit(self.life_icon, (ship_x, ship_y))
+
+    def draw_status(self):
+        """Draw the lives and level strip at the bottom of the screen"""
+        self.screen.blit(self.background, self.status_area, self.status_area)
+        self.draw_lives()
+
+        level_text = GraphicsGenerator.create_text_surface(f"LEVEL: {self.level}", FONT_SMALL)
+        level_x = SCREEN_WIDTH - 50 - level_text.get_width()
+        self.screen.blit(level_text, (level_x, SCREEN_HEIGHT - 40))
 
     def draw(self):
         """Draw the game screen"""
-        # Clear the screen
-        self.screen.fill(BLACK)
+        current_time = pygame.time.get_ticks()
+        hud = (self.score, self.high_score, self.player.lives, self.level)
+
+        # While playing, repaint only what moved, plus the HUD when it changes
+        if self.game_state == STATE_PLAYING and self.last_drawn_state == STATE_PLAYING:
+            dirty = self.playfield.draw(self.screen)
+            if hud != self.last_drawn_hud:
+                self.draw_score()
+                self.draw_status()
+                dirty += [self.score_area, self.status_area]
+                self.last_drawn_hud = hud
+            pygame.display.update(dirty)
+            return
 
-        # Draw game border
-        pygame.draw.rect(self.screen, WHITE, self.game_area, 1)
+        # On the name entry screen most frames only change the pulsing header
+        if (self.game_state == STATE_HIGH_SCORE_ENTRY and self.last_drawn_state == STATE_HIGH_SCORE_ENTRY
+                and self.entry_view(current_time) == self.last_entry_view):
+            dirty = self.draw_entry_header(current_time)
+            if dirty:
+                pygame.display.update(dirty)
+            return
+
+        # On the hall of fame only the scrolling banner moves between star twinkles
+        if (self.game_state == STATE_HALL_OF_FAME and self.last_drawn_state == STATE_HALL_OF_FAME
+                and self.hall_of_fame_view() == self.last_hall_of_fame_view):
+            pygame.display.update(self.draw_banner())
+            return
+
+        # Clear the screen to the backdrop with the game border
+        self.screen.blit(self.background, (0, 0))
 
         # Draw score and high score
         self.draw_score()
@@ -561,12 +722,15 @@ class SpaceInvadersGame:
             self.screen.blit(title_text, (title_x, SCREEN_HEIGHT // 3))
 
             # Draw blinking "PRESS ENTER TO START"
-            if (pygame.time.get_ticks() // 500) % 2 == 0:
+            if (current_time // 500) % 2 == 0:
                 start_text = GraphicsGenerator.create_text_surface("PRESS ENTER TO START", FONT_MEDIUM)
                 start_x = SCREEN_WIDTH // 2 - start_text.get_width() // 2
                 self.screen.blit(start_text, (start_x, SCREEN_HEIGHT // 2))
 
         elif self.game_state == STATE_LEVEL_TRANSITION:
+            # Continue displaying game elements in the background
+            self.draw_playfield()
+
             # Draw level transition screen
             level_complete_text = GraphicsGenerator.create_text_surface(f"LEVEL {self.level} COMPLETE!", FONT_LARGE)
             x = SCREEN_WIDTH // 2 - level_complete_text.get_width() // 2
@@ -578,47 +742,12 @@ class SpaceInvadersGame:
             y = SCREEN_HEIGHT // 2 + 50
             self.screen.blit(next_level_text, (x, y))
 
-            # Continue displaying game elements in the background
-            self.player.draw(self.screen)
-            for barrier in self.barriers:
-                barrier.draw(self.screen)
-
-            # Draw explosions
-            for explosion_sprite, pos in self.explosion_sprites:
-                self.screen.blit(explosion_sprite, pos)
-
         elif self.game_state == STATE_PLAYING or self.game_state == STATE_GAME_OVER:
-            # Draw player
-            self.player.draw(self.screen)
-
-            # Draw invaders
-            self.invader_group.draw(self.screen)
-
-            # Draw mystery ship
-            self.mystery_ship.draw(self.screen)
-
-            # Draw barriers
-            for barrier in self.barriers:
-                barrier.draw(self.screen)
-
-            # Draw bullets
-            for bullet in self.player_bullets:
-                bullet.draw(self.screen)
-
-            for bullet in self.invader_bullets:
-                bullet.draw(self.screen)
+            # Draw player, invaders, mystery ship, barriers, bullets and explosions
+            self.draw_playfield()
 
-            # Draw explosions
-            for explosion_sprite, pos in self.explosion_sprites:
-                self.screen.blit(explosion_sprite, pos)
-
-            # Draw lives
-            self.draw_lives()
-
-            # Draw level
-            level_text = GraphicsGenerator.create_text_surface(f"LEVEL: {self.level}", FONT_SMALL)
-            level_x = SCREEN_WIDTH - 50 - level_text.get_width()
-            self.screen.blit(level_text, (level_x, SCREEN_HEIGHT - 40))
+            # Draw lives and level
+            self.draw_status()
 
             # Draw game over text
             if self.game_state == STATE_GAME_OVER:
@@ -626,25 +755,20 @@ class SpaceInvadersGame:
                 game_over_x = SCREEN_WIDTH // 2 - game_over_text.get_width() // 2
                 self.screen.blit(game_over_text, (game_over_x, SCREEN_HEIGHT // 2))
 
-                if (pygame.time.get_ticks() // 500) % 2 == 0 and pygame.time.get_ticks() - self.game_over_timer > 2000:
+                if (current_time // 500) % 2 == 0 and current_time - self.game_over_timer > 2000:
                     restart_text = GraphicsGenerator.create_text_surface("PRESS ENTER TO RESTART", FONT_MEDIUM)
                     restart_x = SCREEN_WIDTH // 2 - restart_text.get_width() // 2
                     self.screen.blit(restart_text, (restart_x, SCREEN_HEIGHT // 2 + 50))
 
         elif self.game_state == STATE_HIGH_SCORE_ENTRY:
             # Draw retro-styled high score entry screen with decorative elements
+            self.last_entry_view = self.entry_view(current_time)
             # Draw a starfield background effect - reduced frequency for photosensitivity
-            for _ in range(20):  # Reduced from 50 to 20 stars
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                size = random.randint(1, 2)  # Reduced max size from 3 to 2
-                pygame.draw.circle(self.screen, WHITE, (x, y), size)
+            self.screen.blit(self.starfield(20), (0, 0))  # Reduced from 50 to 20 stars
 
             # Draw header with pulsing effect
-            pulse_size = int(abs(math.sin(pygame.time.get_ticks() / 500)) * 8)
-            entry_text = GraphicsGenerator.create_text_surface("NEW HIGH SCORE!", FONT_LARGE + pulse_size)
-            entry_x = SCREEN_WIDTH // 2 - entry_text.get_width() // 2
-            self.screen.blit(entry_text, (entry_x, SCREEN_HEIGHT // 4))
+            self.entry_header = None
+            self.draw_entry_header(current_time)
 
             # Draw score info
             score_text = GraphicsGenerator.create_text_surface(f"SCORE: {self.score}", FONT_MEDIUM)
@@ -662,36 +786,33 @@ class SpaceInvadersGame:
             self.screen.blit(controls_text, (controls_x, SCREEN_HEIGHT // 2 + 80))
 
             # Draw the player's name with the current character highlighted
+            start_x = self.name_start_x
+            char_y = SCREEN_HEIGHT // 2 + 20
             for i, char in enumerate(self.player_name):
                 # Determine color - highlight the current character position
                 color = YELLOW if i == self.current_char else WHITE
-                char_surface = GraphicsGenerator.create_text_surface(char, FONT_LARGE, color)
+                char_surface = self.name_char_surfaces[color][char]
 
                 # Calculate position (centered, with spacing)
-                total_width = HIGH_SCORE_NAME_LENGTH * 40  # 40px per character with spacing
-                start_x = SCREEN_WIDTH // 2 - total_width // 2
                 char_x = start_x + i * 40
-                char_y = SCREEN_HEIGHT // 2 + 20
 
                 # Draw character
                 self.screen.blit(char_surface, (char_x, char_y))
 
                 # Draw selection box around current character
                 if i == self.current_char:
-                    box_rect = pygame.Rect(char_x - 5, char_y - 5, 40, 45)
-                    pygame.draw.rect(self.screen, GREEN, box_rect, 2)
+                    self.selection_box.topleft = (char_x - 5, char_y - 5)
+                    pygame.draw.rect(self.screen, GREEN, self.selection_box, 2)
 
             # Draw blinking indicator for current position
-            if (pygame.time.get_ticks() // 400) % 2 == 0:
+            if (current_time // 400) % 2 == 0:
                 char_index = HIGH_SCORE_CHARS.index(self.player_name[self.current_char])
+                hints = self.name_hint_surfaces
 
                 # Draw up arrow above current character
-                up_char = HIGH_SCORE_CHARS[(char_index - 1) % len(HIGH_SCORE_CHARS)]
-                up_text = GraphicsGenerator.create_text_surface(up_char, FONT_SMALL, (100, 100, 100))
+                up_text = hints[(char_index - 1) % len(hints)]
 
                 # Calculate position
-                total_width = HIGH_SCORE_NAME_LENGTH * 40
-                start_x = SCREEN_WIDTH // 2 - total_width // 2
                 up_x = start_x + self.current_char * 40
                 up_y = SCREEN_HEIGHT // 2 - 5
 
@@ -699,25 +820,23 @@ class SpaceInvadersGame:
                 self.screen.blit(up_text, (up_x, up_y))
 
                 # Draw down arrow below current character
-                down_char = HIGH_SCORE_CHARS[(char_index + 1) % len(HIGH_SCORE_CHARS)]
-                down_text = GraphicsGenerator.create_text_surface(down_char, FONT_SMALL, (100, 100, 100))
+                down_text = hints[(char_index + 1) % len(hints)]
                 down_y = SCREEN_HEIGHT // 2 + 70
 
                 self.screen.blit(down_text, (up_x, down_y))
 
         elif self.game_state == STATE_HALL_OF_FAME:
             # Draw retro-styled hall of fame display
+            self.last_hall_of_fame_view = self.hall_of_fame_view()
 
             # Draw a starfield background effect - reduced frequency for photosensitivity
-            for _ in range(40):  # Reduced from 100 to 40 stars
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                size = random.randint(1, 2)  # Reduced max size from 3 to 2
-                pygame.draw.circle(self.screen, WHITE, (x, y), size)
+            self.screen.blit(self.starfield(40), (0, 0))  # Reduced from 100 to 40 stars
+
+            hall_of_fame_text = self.hall_of_fame_text
 
             # Draw title - removed blue box background
             title_y = 50
-            title_text = GraphicsGenerator.create_text_surface("* HALL OF FAME *", FONT_LARGE)
+            title_text = hall_of_fame_text["title"]
             title_x = SCREEN_WIDTH // 2 - title_text.get_width() // 2
 
             # Simple underline instead of box
@@ -728,88 +847,72 @@ class SpaceInvadersGame:
 
             self.screen.blit(title_text, (title_x, title_y))
 
-            # Draw table headers
-            header_y = 120
-            pygame.draw.line(self.screen, WHITE, (100, header_y), (SCREEN_WIDTH - 100, header_y), 2)
-
-            rank_text = GraphicsGenerator.create_text_surface("RANK", FONT_SMALL)
-            name_text = GraphicsGenerator.create_text_surface("NAME", FONT_SMALL)
-            score_text = GraphicsGenerator.create_text_surface("SCORE", FONT_SMALL)
-            level_text = GraphicsGenerator.create_text_surface("LEVEL", FONT_SMALL)
-
-            self.screen.blit(rank_text, (120, header_y - 25))
-            self.screen.blit(name_text, (220, header_y - 25))
-            self.screen.blit(score_text, (400, header_y - 25))
-            self.screen.blit(level_text, (550, header_y - 25))
-
-            # Draw high scores with alternating row colors
-            high_scores = self.high_score_manager.get_high_scores()
-            start_y = 150
-
-            for i, entry in enumerate(high_scores):
-                row_y = start_y + i * 35
-
-                # Draw alternating row backgrounds
-                if i % 2 == 0:
-                    pygame.draw.rect(self.screen, (20, 20, 50),
-                                    (100, row_y - 5, SCREEN_WIDTH - 200, 30))
-
-                # Get entry data
-                rank = f"{i + 1}."
-                name = entry["name"]
-                score = str(entry["score"]).zfill(4)
-                level = f"{entry['level']}"
-
-                # Highlight top 3 rankings with special colors
-                rank_color = WHITE
-                if i == 0:
-                    rank_color = YELLOW  # Gold for 1st
-                elif i == 1:
-                    rank_color = (200, 200, 200)  # Silver for 2nd
-                elif i == 2:
-                    rank_color = (184, 115, 51)  # Bronze for 3rd
-
-                # Draw entry data
-                rank_surf = GraphicsGenerator.create_text_surface(rank, FONT_MEDIUM, rank_color)
-                name_surf = GraphicsGenerator.create_text_surface(name, FONT_MEDIUM, WHITE)
-                score_surf = GraphicsGenerator.create_text_surface(score, FONT_MEDIUM, GREEN)
-                level_surf = GraphicsGenerator.create_text_surface(level, FONT_MEDIUM, RED)
-
-                self.screen.blit(rank_surf, (120, row_y))
-                self.screen.blit(name_surf, (220, row_y))
-                self.screen.blit(score_surf, (400, row_y))
-                self.screen.blit(level_surf, (550, row_y))
+            # Draw table headers and high scores in one go
+            self.screen.blit(self.hall_of_fame_table, (0, HALL_OF_FAME_TABLE_Y))
 
             # Draw instructions
-            pygame.draw.rect(self.screen, BLACK, (0, SCREEN_HEIGHT - 70, SCREEN_WIDTH, 70))
+            self.screen.fill(BLACK, self.hall_of_fame_keys_area)
 
             keys_y = SCREEN_HEIGHT - 60
-            enter_text = GraphicsGenerator.create_text_surface("ENTER: NEW GAME", FONT_SMALL)
-            q_text = GraphicsGenerator.create_text_surface("Q: RESET SCORES", FONT_SMALL)
-            esc_text = GraphicsGenerator.create_text_surface("ESC: QUIT", FONT_SMALL)
-
-            self.screen.blit(enter_text, (120, keys_y))
-            self.screen.blit(q_text, (350, keys_y))
-            self.screen.blit(esc_text, (580, keys_y))
+            self.screen.blit(hall_of_fame_text["enter"], (120, keys_y))
+            self.screen.blit(hall_of_fame_text["q"], (350, keys_y))
+            self.screen.blit(hall_of_fame_text["esc"], (580, keys_y))
 
             # Draw scrolling banner at bottom with credits
-            banner_y = SCREEN_HEIGHT - 30
-            banner_text = "CREATED BY CLAUDE 3.7 AND IAN      *      SPACE INVADERS      *      " + time.strftime("%d %b %Y")
-            # Create a doubly long text to handle scrolling
-            banner_surface = GraphicsGenerator.create_text_surface(banner_text + "      " + banner_text, FONT_SMALL, YELLOW)
-
-            # Create scrolling effect
-            scroll_width = banner_surface.get_width()
-            if self.scroll_position < -scroll_width // 2:
-                self.scroll_position = 0
-
-            self.screen.blit(banner_surface, (self.scroll_position, banner_y))
-
-            # Draw a decorative border around the screen
-            pygame.draw.rect(self.screen, GREEN, (10, 10, SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20), 1)
+            self.draw_banner()
 
         # Update the display
         pygame.display.flip()
+        self.last_drawn_state = self.game_state
+        self.last_drawn_hud = hud
+
+    def entry_view(self, current_time):
+        """Everything shown on the name entry screen apart from the pulsing header"""
+        return (self.starfield(20), tuple(self.player_name), self.current_char,
+                (current_time // 400) % 2, self.score, self.high_score)
+
+    def draw_entry_header(self, current_time):
+        """Draw the pulsing "NEW HIGH SCORE!" header; return the area that changed, if any"""
+        pulse_size = int(abs(math.sin(current_time / 500)) * 8)
+        entry_text = GraphicsGenerator.create_text_surface("NEW HIGH SCORE!", FONT_LARGE + pulse_size)
+        entry_x = SCREEN_WIDTH // 2 - entry_text.get_width() // 2
+        rect = entry_text.get_rect(topleft=(entry_x, SCREEN_HEIGHT // 4))
+
+        old_header = self.entry_header
+        if old_header and old_header[0] == pulse_size:
+            return None
+        self.entry_header = (pulse_size, rect)
+
+        # Repaint the backdrop and stars under both the old and new header, then the header
+        dirty = rect.union(old_header[1]) if old_header else rect
+        self.screen.blit(self.background, dirty, dirty)
+        self.screen.blit(self.starfield(20), dirty, dirty)
+        self.screen.blit(entry_text, rect)
+        return dirty
+
+    def hall_of_fame_view(self):
+        """Everything shown on the hall of fame apart from the scrolling banner"""
+        return (self.starfield(40), self.hall_of_fame_table)
+
+    def draw_banner(self):
+        """Draw the hall of fame's scrolling banner and border; return the strip that changed"""
+        banner_surface = self.hall_of_fame_text["banner"]
+        strip = self.banner_area
+        self.screen.fill(BLACK, strip)
+
+        # Create scrolling effect by tiling the banner from the scroll offset
+        tile_width = banner_surface.get_width()
+        for x in range(-self.scroll_position, SCREEN_WIDTH, tile_width):
+            self.screen.blit(banner_surface, (x, strip.y))
+
+        # Draw a decorative border around the screen, which the banner runs underneath
+        pygame.draw.rect(self.screen, GREEN, self.screen_border, 1)
+        return strip
+
+    def draw_playfield(self):
+        """Repaint every sprite on the play field"""
+        self.playfield.repaint_rect(self.playfield_clip)
+        self.playfield.draw(self.screen)
 
     def run(self):
         """Main game loop"""
@@ -821,69 +924,69 @@ class SpaceInvadersGame:
 
         pygame.quit()
 
-    def update_high_score_entry(self):
-        """Update the high score name entry screen"""
-        current_time = pygame.time.get_ticks()
-
-        # Handle cooldown for character selection
-        if current_time - self.name_entry_cooldown < self.name_entry_delay:
-            return
-
-        keys = pygame.key.get_pressed()
-
-        # Navigate left/right to select character position
-        if keys[pygame.K_LEFT]:
-            self.current_char = (self.current_char - 1) % HIGH_SCORE_NAME_LENGTH
-            self.name_entry_cooldown = current_time
-        elif keys[pygame.K_RIGHT]:
-            self.current_char = (self.current_char + 1) % HIGH_SCORE_NAME_LENGTH
-            self.name_entry_cooldown = current_time
-
-        # Change the character at current position
-        if keys[pygame.K_UP]:
-            # Move to previous character in the list
-            self.char_index = (self.char_index - 1) % len(HIGH_SCORE_CHARS)
-            self.player_name[self.current_char] = HIGH_SCORE_CHARS[self.char_index]
-            self.name_entry_cooldown = current_time
-        elif keys[pygame.K_DOWN]:
-            # Move to next character in the list
-            self.char_index = (self.char_index + 1) % len(HIGH_SCORE_CHARS)
-            self.player_name[self.current_char] = HIGH_SCORE_CHARS[self.char_index]
-            self.name_entry_cooldown = current_time
-
-        # Space or Enter to confirm name
-        if keys[pygame.K_SPACE] or keys[pygame.K_RETURN]:
-            self.submit_high_score()
-
     def submit_high_score(self):
         """Submit the high score to the hall of fame"""
+        pygame.key.set_repeat()  # Back to one KEYDOWN per press
         name = "".join(self.player_name)
         self.high_score_manager.add_score(name, self.score, self.level)
         self.game_state = STATE_HALL_OF_FAME
         self.scroll_position = 0
         self.scroll_timer = pygame.time.get_ticks()
+        self.build_hall_of_fame()
+
+    def reset_high_scores(self):
+        """Reset the hall of fame and redraw its table"""
+        self.high_score_manager.reset_scores()
+        self.build_hall_of_fame()
+
+    def build_hall_of_fame(self):
+        """Render the hall of fame text once, rather than every frame"""
+        text = GraphicsGenerator.create_text_surface
+        banner_text = "CREATED BY CLAUDE 3.7 AND IAN      *      SPACE INVADERS      *      " + time.strftime("%d %b %Y")
+        self.hall_of_fame_text = {
+            "title": text("* HALL OF FAME *", FONT_LARGE),
+            "enter": text("ENTER: NEW GAME", FONT_SMALL),
+            "q": text("Q: RESET SCORES", FONT_SMALL),
+            "esc": text("ESC: QUIT", FONT_SMALL),
+            # One period of the banner, tiled across the screen as it scrolls
+            "banner": text(banner_text + "      ", FONT_SMALL, YELLOW),
+        }
+        self.banner_area.height = self.hall_of_fame_text["banner"].get_height()
+
+        # The table is composed once into a surface of its own, from the column headers down
+        high_scores = self.high_score_manager.get_high_scores()
+        header_y = 120 - HALL_OF_FAME_TABLE_Y
+        start_y = 150 - HALL_OF_FAME_TABLE_Y
+        table = pygame.Surface((SCREEN_WIDTH, start_y + len(high_scores) * 35), pygame.SRCALPHA)
 
-    def update_hall_of_fame(self):
-        """Update the hall of fame display"""
-        current_time = pygame.time.get_ticks()
+        # Draw table headers
+        pygame.draw.line(table, WHITE, (100, header_y), (SCREEN_WIDTH - 100, header_y), 2)
+        table.blit(text("RANK", FONT_SMALL), (120, header_y - 25))
+        table.blit(text("NAME", FONT_SMALL), (220, header_y - 25))
+        table.blit(text("SCORE", FONT_SMALL), (400, header_y - 25))
+        table.blit(text("LEVEL", FONT_SMALL), (550, header_y - 25))
 
-        # Update scrolling banner position
-        self.scroll_position -= self.scroll_speed
-        # Reset when text scrolls off screen (assuming banner is 800px wide)
-        if self.scroll_position < -800:
-            self.scroll_position = SCREEN_WIDTH
+        # Highlight top 3 rankings with gold, silver and bronze
+        rank_colors = (YELLOW, (200, 200, 200), (184, 115, 51))
 
-        # Check for key presses
-        keys = pygame.key.get_pressed()
+        # Draw high scores with alternating row colors
+        for i, entry in enumerate(high_scores):
+            row_y = start_y + i * 35
 
-        if keys[pygame.K_q]:
-            # Reset high scores
-            self.high_score_manager.reset_scores()
+            # Draw alternating row backgrounds
+            if i % 2 == 0:
+                pygame.draw.rect(table, (20, 20, 50), (100, row_y - 5, SCREEN_WIDTH - 200, 30))
 
-        elif keys[pygame.K_RETURN]:
-            # Start a new game
-            self.start_new_game()
+            # Draw entry data
+            table.blit(text(f"{i + 1}.", FONT_MEDIUM, rank_colors[i] if i < 3 else WHITE), (120, row_y))
+            table.blit(text(entry["name"], FONT_MEDIUM, WHITE), (220, row_y))
+            table.blit(text(str(entry["score"]).zfill(4), FONT_MEDIUM, GREEN), (400, row_y))
+            table.blit(text(f"{entry['level']}", FONT_MEDIUM, RED), (550, row_y))
 
-        elif keys[pygame.K_ESCAPE]:
-            # Exit game
-            self.running = False
\ No newline at end of file
+        self.hall_of_fame_table = table.convert_alpha()  # Match the display format, as the generated surfaces do
+
+    def update_hall_of_fame(self):
+        """Update the hall of fame display; its keys are handled as KEYDOWN events in handle_events"""
+        # Update scrolling banner position, wrapping after one period of the banner
+        tile_width = self.hall_of_fame_text["banner"].get_width()
+        self.scroll_position = (self.scroll_position + self.scroll_speed) % tile_width
\ No newline at end of file
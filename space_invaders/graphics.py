@@ -1,8 +1,39 @@
 #!/usr/bin/env python3
 import pygame
-import random
+import numpy as np
+from functools import lru_cache
 from space_invaders.constants import *
 
+_RNG = np.random.default_rng()
+
+
+def _display_format(surface):
+    """Convert a finished surface to the display's pixel format, so blits take the fast path"""
+    if pygame.display.get_surface() is None:
+        return surface  # No display yet, e.g. when generating sprites offline
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+@lru_cache(maxsize=16)
+def _get_font(size):
+    """Open the pixel font once per size"""
+    return pygame.font.SysFont('Courier', size, bold=True)
+
+
+@lru_cache(maxsize=512)
+def _render_text(text, size, color):
+    """Render a string once per (text, size, color)"""
+    return _display_format(_get_font(size).render(text, False, color))
+
+
+# Lit segments of each score digit 0-9, one bit per segment: bit 0 top, 1 top-left,
+# 2 top-right, 3 middle, 4 bottom-left, 5 bottom-right, 6 bottom
+_DIGIT_SEGMENTS = (0b1110111, 0b0100100, 0b1011101, 0b1101101, 0b0101110,
+                   0b1101011, 0b1111011, 0b0100101, 0b1111111, 0b1101111)
+
+
 class GraphicsGenerator:
     """Generate retro-style pixel art for Space Invaders"""
     
@@ -19,11 +50,12 @@ class GraphicsGenerator:
         cannon_rect = pygame.Rect(PLAYER_WIDTH // 2 - 5, 0, 10, PLAYER_HEIGHT - 10)
         pygame.draw.rect(surface, GREEN, cannon_rect)
         
-        return surface
+        return _display_format(surface)
         
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_invader(invader_type):
-        """Create an invader sprite based on its type (0, 1, or 2)"""
+        """Create an invader sprite based on its type (0, 1, or 2), once per type"""
         surface = pygame.Surface((INVADER_WIDTH, INVADER_HEIGHT), pygame.SRCALPHA)
         color = GREEN
         
@@ -94,26 +126,34 @@ class GraphicsGenerator:
             pygame.draw.rect(surface, BLACK, left_eye)
             pygame.draw.rect(surface, BLACK, right_eye)
             
-        return surface
+        return _display_format(surface)
         
     @staticmethod
     def create_alternate_frame(sprite):
         """Create an alternate animation frame for sprites"""
         alt_sprite = sprite.copy()
-        width = sprite.get_width()
-        height = sprite.get_height()
+        width, height = sprite.get_size()
+        src_rgb = pygame.surfarray.array3d(sprite)
+        src_alpha = pygame.surfarray.array_alpha(sprite)
+        
+        # Only the lower half of the left and right edges moves
+        edges = np.zeros((width, height), dtype=bool)
+        columns = np.arange(width)
+        edges[(columns < width // 4) | (columns > width * 3 // 4), height // 2 + 1:] = True
+        opaque = edges & (src_alpha > 0)
+        
+        # Each run of opaque edge pixels is cleared, and its last pixel reappears one row lower
+        moved = np.zeros_like(opaque)
+        moved[:, 1:] = opaque[:, :-1] & ~opaque[:, 1:]
+        xs, ys = np.nonzero(moved)
         
-        # Modify some pixels to create animation effect
-        for x in range(width):
-            for y in range(height):
-                if x < width // 4 or x > width * 3 // 4:
-                    if sprite.get_at((x, y))[3] > 0:  # If pixel is not transparent
-                        # Shift certain edge pixels to create movement illusion
-                        if y > height // 2:
-                            alt_sprite.set_at((x, y), (0, 0, 0, 0))  # Make transparent
-                            if y < height - 1:
-                                color = sprite.get_at((x, y))
-                                alt_sprite.set_at((x, y + 1), color)
+        rgb = pygame.surfarray.pixels3d(alt_sprite)
+        alpha = pygame.surfarray.pixels_alpha(alt_sprite)
+        rgb[opaque] = 0
+        alpha[opaque] = 0
+        rgb[xs, ys] = src_rgb[xs, ys - 1]
+        alpha[xs, ys] = src_alpha[xs, ys - 1]
+        del rgb, alpha  # Release the pixel views so the surface unlocks
         
         return alt_sprite
     
@@ -140,57 +180,61 @@ class GraphicsGenerator:
             window_rect = pygame.Rect(window_x, window_y, window_size, window_size)
             pygame.draw.rect(surface, YELLOW, window_rect)
         
-        return surface
+        return _display_format(surface)
         
-    @staticmethod
-    def create_barrier_piece():
-        """Create a single piece of the defensive barriers"""
-        piece_size = 5
-        surface = pygame.Surface((piece_size, piece_size))
-        surface.fill(GREEN)
-        return surface
-    
     @staticmethod
     def create_barrier():
         """Create a defensive barrier made up of small blocks"""
         surface = pygame.Surface((BARRIER_WIDTH, BARRIER_HEIGHT), pygame.SRCALPHA)
         piece_size = 5
+        pieces_x = BARRIER_WIDTH // piece_size
+        pieces_y = BARRIER_HEIGHT // piece_size
         
-        # Draw the main barrier shape (fortress-like)
-        for x in range(BARRIER_WIDTH // piece_size):
-            for y in range(BARRIER_HEIGHT // piece_size):
-                # Skip the bottom corners to create an arch
-                if (y > BARRIER_HEIGHT // piece_size * 2 // 3 and 
-                    (x < BARRIER_WIDTH // piece_size // 4 or 
-                     x > BARRIER_WIDTH // piece_size * 3 // 4)):
-                    continue
-                
-                # Create the middle arch opening
-                if (y > BARRIER_HEIGHT // piece_size // 2 and 
-                    x > BARRIER_WIDTH // piece_size // 3 and 
-                    x < BARRIER_WIDTH // piece_size * 2 // 3):
-                    continue
-                
-                piece = GraphicsGenerator.create_barrier_piece()
-                surface.blit(piece, (x * piece_size, y * piece_size))
+        # Piece rows and columns where the arch starts, counted in pieces
+        arch_row = pieces_y * 2 // 3
+        corner_left = pieces_x // 4
+        corner_right = pieces_x * 3 // 4
+        opening_top = pieces_y // 2
+        opening_left = pieces_x // 3
+        opening_right = pieces_x * 2 // 3
+        
+        # Mark the pieces of the main barrier shape (fortress-like), indexed [x, y]
+        solid = np.ones((pieces_x, pieces_y), dtype=bool)
+        
+        # Skip the bottom corners to create an arch
+        solid[:corner_left, arch_row + 1:] = False
+        solid[corner_right + 1:, arch_row + 1:] = False
+        
+        # Create the middle arch opening
+        solid[opening_left + 1:opening_right, opening_top + 1:] = False
+        
+        # Scale each piece up to piece_size pixels and paint them all in one go
+        pixels = solid.repeat(piece_size, axis=0).repeat(piece_size, axis=1)
+        width, height = pixels.shape
+        rgb = pygame.surfarray.pixels3d(surface)
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        rgb[:width, :height][pixels] = GREEN
+        alpha[:width, :height][pixels] = 255
+        del rgb, alpha  # Release the pixel views so the surface unlocks
                 
-        return surface
+        return _display_format(surface)
     
     @staticmethod
     def create_explosion(size):
         """Create an explosion sprite"""
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
         
-        # Draw random explosion particles
+        # Draw random explosion particles, with all their random numbers drawn in one call
         num_particles = 20
-        for _ in range(num_particles):
-            x = random.randint(0, size - 1)
-            y = random.randint(0, size - 1)
-            radius = random.randint(1, size // 5)
-            color = random.choice([YELLOW, RED, WHITE])
-            pygame.draw.circle(surface, color, (x, y), radius)
+        palette = (YELLOW, RED, WHITE)
+        high = (size, size, size // 5 + 1, len(palette))
+        particles = _RNG.integers((0, 0, 1, 0), high, size=(num_particles, 4)).tolist()
+        surface.lock()  # One lock for all the circles instead of one each
+        for x, y, radius, color in particles:
+            pygame.draw.circle(surface, palette[color], (x, y), radius)
+        surface.unlock()
             
-        return surface
+        return _display_format(surface)
     
     @staticmethod
     def create_bullet(bullet_type):
@@ -222,52 +266,53 @@ class GraphicsGenerator:
             
             pygame.draw.lines(surface, WHITE, False, points, 2)
             
-        return surface
+        return _display_format(surface)
+    
+    @staticmethod
+    def load_fonts(*sizes):
+        """Open the pixel font for each size up front, so the first frames don't pay for it"""
+        for size in sizes:
+            _get_font(size)
     
     @staticmethod
     def create_text_surface(text, size, color=WHITE):
         """Create a text surface using a pixel font effect"""
-        # Create our own pixelated font
-        font = pygame.font.SysFont('Courier', size, bold=True)
-        text_surface = font.render(text, False, color)
-        return text_surface
+        # Fonts and rendered strings are cached, so callers share the returned surface
+        return _render_text(text, size, tuple(color))
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_digit_sprites():
-        """Create sprites for score digits (0-9)"""
+        """Create sprites for score digits (0-9), once; returned as a shared tuple"""
         digit_sprites = []
         digit_width = 20
         digit_height = 30
         
-        for i in range(10):
+        # End points of each segment, in the bit order of _DIGIT_SEGMENTS
+        right = digit_width - 3
+        middle = digit_height // 2
+        bottom = digit_height - 3
+        segments = (
+            ((2, 2), (right, 2)),                    # Top horizontal
+            ((2, 3), (2, middle - 1)),               # Top-left vertical
+            ((right, 3), (right, middle - 1)),       # Top-right vertical
+            ((2, middle), (right, middle)),          # Middle horizontal
+            ((2, middle + 1), (2, bottom)),          # Bottom-left vertical
+            ((right, middle + 1), (right, bottom)),  # Bottom-right vertical
+            ((2, bottom), (right, bottom)),          # Bottom horizontal
+        )
+        
+        for lit in _DIGIT_SEGMENTS:
             surface = pygame.Surface((digit_width, digit_height), pygame.SRCALPHA)
             
             # Draw digit outline
             pygame.draw.rect(surface, WHITE, (0, 0, digit_width, digit_height), 2)
             
-            # Draw the segments for each digit
-            if i in [0, 2, 3, 5, 6, 7, 8, 9]:  # Top horizontal
-                pygame.draw.line(surface, WHITE, (2, 2), (digit_width - 3, 2), 2)
-                
-            if i in [0, 4, 5, 6, 8, 9]:  # Top-left vertical
-                pygame.draw.line(surface, WHITE, (2, 3), (2, digit_height // 2 - 1), 2)
-                
-            if i in [0, 1, 2, 3, 4, 7, 8, 9]:  # Top-right vertical
-                pygame.draw.line(surface, WHITE, (digit_width - 3, 3), (digit_width - 3, digit_height // 2 - 1), 2)
-                
-            if i in [2, 3, 4, 5, 6, 8, 9]:  # Middle horizontal
-                pygame.draw.line(surface, WHITE, (2, digit_height // 2), (digit_width - 3, digit_height // 2), 2)
-                
-            if i in [0, 2, 6, 8]:  # Bottom-left vertical
-                pygame.draw.line(surface, WHITE, (2, digit_height // 2 + 1), (2, digit_height - 3), 2)
-                
-            if i in [0, 1, 3, 4, 5, 6, 7, 8, 9]:  # Bottom-right vertical
-                pygame.draw.line(surface, WHITE, (digit_width - 3, digit_height // 2 + 1), 
-                               (digit_width - 3, digit_height - 3), 2)
-                
-            if i in [0, 2, 3, 5, 6, 8, 9]:  # Bottom horizontal
-                pygame.draw.line(surface, WHITE, (2, digit_height - 3), (digit_width - 3, digit_height - 3), 2)
+            # Draw the segments lit for this digit
+            for bit, (start, end) in enumerate(segments):
+                if lit & (1 << bit):
+                    pygame.draw.line(surface, WHITE, start, end, 2)
                 
             digit_sprites.append(surface)
             
-        return digit_sprites
\ No newline at end of file
+        return tuple(_display_format(surface) for surface in digit_sprites)
\ No newline at end of file
@@ -1,7 +1,56 @@
 #!/usr/bin/env python3
+import os
+import hashlib
+from functools import lru_cache
 import pygame
 import numpy as np
-import random
+from space_invaders.constants import *
+
+# One cycle of a sine wave; waveforms read it at their phase instead of evaluating np.sin per sample
+_SINE_TABLE_SIZE = 4096  # A power of two, so phases wrap with a bit mask
+_SINE_TABLE = np.sin(2 * np.pi * np.arange(_SINE_TABLE_SIZE) / _SINE_TABLE_SIZE).astype(np.float32)
+
+
+def _sine(phase):
+    """Sine of a phase given in cycles, looked up in the sine table"""
+    index = (phase * _SINE_TABLE_SIZE).astype(np.int64) & (_SINE_TABLE_SIZE - 1)
+    return _SINE_TABLE[index]
+
+
+def _sweep_phase(freq, sample_rate):
+    """Phase in cycles of a tone whose frequency changes sample by sample, integrated rather than freq * t"""
+    return np.cumsum(freq / sample_rate, dtype=np.float64).astype(np.float32)  # A float32 running sum drifts audibly over seconds
+
+
+@lru_cache(maxsize=16)
+def _time_axis(sample_rate, duration):
+    """Sample times for a sound of the given length, shared read-only between generators"""
+    t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=np.float32)
+    t.flags.writeable = False
+    return t
+
+
+def _to_pcm(waveform, channels):
+    """Convert a float waveform to 16-bit samples on each channel, clipping and scaling it in place first"""
+    np.clip(waveform, -1, 1, out=waveform)
+    waveform *= 32767
+    samples = np.empty((waveform.size, channels), np.int16)
+    samples[:] = waveform[:, None]  # One pass that casts and fills every channel
+    return samples
+
+
+def _decay_envelope(num_samples, decay, sample_rate):
+    """exp(-decay * t) over num_samples"""
+    return np.exp(np.arange(num_samples, dtype=np.float32) * np.float32(-decay / sample_rate))
+
+
+def _decaying_sweep(freq, decay, gain, sample_rate):
+    """Sine wave following freq sample by sample under an exp(-decay * t) envelope"""
+    waveform = _sine(_sweep_phase(freq, sample_rate))
+    waveform *= _decay_envelope(freq.size, decay, sample_rate)
+    waveform *= gain
+    return waveform
+
 
 class SoundGenerator:
     """Generate retro-style sound effects programmatically"""
@@ -11,18 +60,75 @@ class SoundGenerator:
         pygame.mixer.init(frequency=44100, size=-16, channels=2)  # Changed to 2 channels
         self.sounds = {}
         self.num_channels = 2  # Store channel count to use in sound generation
+        self.rng = np.random.default_rng(0)  # Seeded, so the noisy effects come out the same every run
+        self.sound_cache_dir = self.cache_dir()
+        
+        # Load every sound up front, generating any the cache is missing, so none is built mid-game
+        self.generators = {
+            "player_shoot": self.generate_player_shoot,
+            "invader_shoot": self.generate_invader_shoot,
+            "player_explosion": self.generate_player_explosion,
+            "invader_explosion": self.generate_invader_explosion,
+            "mystery_ship": self.generate_mystery_ship,
+            "mystery_ship_hit": self.generate_mystery_ship_hit,
+            "game_over": self.generate_game_over,
+            "invader_movement": self.generate_invader_movement_sounds,
+        }
+        for sound_name in self.generators:
+            self.get_sound(sound_name)
+        
+    def cache_dir(self):
+        """Cache directory for this version of the generators and this mixer format, or None without one"""
+        try:
+            with open(__file__, "rb") as source:
+                key = hashlib.sha1(source.read())
+        except OSError:
+            return None  # No source to key the cache on (e.g. a frozen build); sounds are generated every run
+        key.update(repr(pygame.mixer.get_init()).encode())
+        return os.path.join(SOUND_CACHE_DIR, "sounds-" + key.hexdigest()[:16])
+    
+    def load_sound(self, path, generate):
+        """Load a sound's samples from the cache, generating and caching them on a miss"""
+        try:
+            return pygame.sndarray.make_sound(np.load(path))
+        except (OSError, ValueError, EOFError):
+            pass  # Not cached yet, or unreadable
+        
+        sound = generate()
+        temp_path = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temp_path, "wb") as cache_file:
+                np.save(cache_file, pygame.sndarray.array(sound))
+            os.replace(temp_path, path)  # Readers only ever see a complete file
+        except OSError:
+            # Caching is best effort; the sound is simply generated again next run
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return sound
         
-    def generate_all_sounds(self):
-        """Generate all game sounds"""
-        self.sounds["player_shoot"] = self.generate_player_shoot()
-        self.sounds["invader_shoot"] = self.generate_invader_shoot()
-        self.sounds["player_explosion"] = self.generate_player_explosion()
-        self.sounds["invader_explosion"] = self.generate_invader_explosion()
-        self.sounds["mystery_ship"] = self.generate_mystery_ship()
-        self.sounds["mystery_ship_hit"] = self.generate_mystery_ship_hit()
-        self.sounds["game_over"] = self.generate_game_over()
-        self.sounds["invader_movement"] = self.generate_invader_movement_sounds()
-        
+    def white_noise(self, num_samples, amplitude):
+        """Uniform float32 noise in [-amplitude, amplitude), drawn straight into its buffer"""
+        noise = np.empty(num_samples, np.float32)
+        self.rng.random(out=noise, dtype=np.float32)
+        noise *= 2 * amplitude
+        noise -= amplitude
+        return noise
+        
+    def get_sound(self, sound_name):
+        """Get a sound by name, loading it from the cache or generating it if it is not loaded yet"""
+        sound = self.sounds.get(sound_name)
+        if sound is None:
+            if self.sound_cache_dir is None:
+                sound = self.generators[sound_name]()
+            else:
+                path = os.path.join(self.sound_cache_dir, sound_name + ".npy")
+                sound = self.load_sound(path, self.generators[sound_name])
+            self.sounds[sound_name] = sound
+        return sound
+    
     def play_sound(self, sound_name):
         """Play a sound by name"""
         if sound_name in self.sounds:
@@ -38,28 +144,17 @@ class SoundGenerator:
         # Create a short high-pitched zap
         sample_rate = 44100
         duration = 0.2  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
         
         # Start with a higher frequency and decrease
         freq_start = 1000
         freq_end = 300
-        freq = np.linspace(freq_start, freq_end, int(sample_rate * duration))
-        
-        # Generate the waveform
-        waveform = np.sin(2 * np.pi * freq * t) * 0.5
+        freq = np.linspace(freq_start, freq_end, int(sample_rate * duration), dtype=np.float32)
         
-        # Apply a quick decay envelope
-        envelope = np.exp(-5 * t)
-        waveform = waveform * envelope
+        # Generate the waveform with a quick decay envelope
+        waveform = _decaying_sweep(freq, 5.0, 0.5, sample_rate)
         
-        # Convert to 16-bit PCM
-        waveform = (waveform * 32767).astype(np.int16)
-        
-        # Duplicate mono to match channel count (stereo)
-        if self.num_channels > 1:
-            waveform = np.column_stack([waveform] * self.num_channels)
-        else:
-            waveform = waveform.reshape(-1, 1)
+        # Convert to 16-bit PCM, written straight to every channel (stereo)
+        waveform = _to_pcm(waveform, self.num_channels)
         
         # Create and return PyGame sound
         sound = pygame.sndarray.make_sound(waveform)
@@ -70,31 +165,24 @@ class SoundGenerator:
         # Create an alien-like descending tone
         sample_rate = 44100
         duration = 0.3  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = _time_axis(sample_rate, duration)
         
         # Complex frequency modulation for alien feel
         freq_base = 400
         freq_mod = 100
-        freq = freq_base - freq_mod * np.sin(2 * np.pi * 3 * t)
+        freq = freq_base - freq_mod * _sine(3 * t)
         
         # Generate the waveform with some noise
-        waveform = np.sin(2 * np.pi * freq * t) * 0.5
-        noise = np.random.uniform(-0.2, 0.2, size=len(t))
-        waveform = waveform + noise
+        waveform = _sine(_sweep_phase(freq, sample_rate)) * 0.5
+        noise = self.white_noise(len(t), 0.2)
+        waveform += noise
         
         # Apply envelope
-        envelope = np.exp(-3 * t)
-        waveform = waveform * envelope
-        
-        # Convert to 16-bit PCM
-        waveform = np.clip(waveform, -1, 1) * 32767
-        waveform = waveform.astype(np.int16)
+        envelope = _decay_envelope(len(t), 3, sample_rate)
+        waveform *= envelope
         
-        # Duplicate mono to match channel count (stereo)
-        if self.num_channels > 1:
-            waveform = np.column_stack([waveform] * self.num_channels)
-        else:
-            waveform = waveform.reshape(-1, 1)
+        # Convert to 16-bit PCM, written straight to every channel (stereo)
+        waveform = _to_pcm(waveform, self.num_channels)
         
         # Create and return PyGame sound
         sound = pygame.sndarray.make_sound(waveform)
@@ -105,37 +193,25 @@ class SoundGenerator:
         # Create an explosion sound
         sample_rate = 44100
         duration = 0.5  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = _time_axis(sample_rate, duration)
         
         # White noise as base
-        waveform = np.random.uniform(-0.8, 0.8, size=len(t))
+        waveform = self.white_noise(len(t), 0.8)
         
         # Add some low frequency rumble
         rumble_freq = 30
-        rumble = np.sin(2 * np.pi * rumble_freq * t) * 0.3
-        waveform = waveform + rumble
+        rumble = _sine(rumble_freq * t) * 0.3
+        waveform += rumble
         
         # Apply envelope - quick attack, slower decay
         attack = 0.05
         decay = duration - attack
-        envelope = np.ones_like(t)
-        attack_mask = t < attack
-        decay_mask = t >= attack
+        split = int(attack * sample_rate)
+        waveform[:split] *= t[:split] / attack
+        waveform[split:] *= _decay_envelope(len(t) - split, 1 / (decay * 0.5), sample_rate)
         
-        envelope[attack_mask] = t[attack_mask] / attack
-        envelope[decay_mask] = np.exp(-(t[decay_mask] - attack) / (decay * 0.5))
-        
-        waveform = waveform * envelope
-        
-        # Convert to 16-bit PCM
-        waveform = np.clip(waveform, -1, 1) * 32767
-        waveform = waveform.astype(np.int16)
-        
-        # Duplicate mono to match channel count (stereo)
-        if self.num_channels > 1:
-            waveform = np.column_stack([waveform] * self.num_channels)
-        else:
-            waveform = waveform.reshape(-1, 1)
+        # Convert to 16-bit PCM, written straight to every channel (stereo)
+        waveform = _to_pcm(waveform, self.num_channels)
         
         # Create and return PyGame sound
         sound = pygame.sndarray.make_sound(waveform)
@@ -146,32 +222,25 @@ class SoundGenerator:
         # Create an alien death sound
         sample_rate = 44100
         duration = 0.4  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = _time_axis(sample_rate, duration)
         
         # High pitched descending tone with noise
         freq_start = 800
         freq_end = 200
-        freq = np.linspace(freq_start, freq_end, int(sample_rate * duration))
+        freq = np.linspace(freq_start, freq_end, int(sample_rate * duration), dtype=np.float32)
         
-        tone = np.sin(2 * np.pi * freq * t) * 0.5
-        noise = np.random.uniform(-0.5, 0.5, size=len(t))
+        tone = _sine(_sweep_phase(freq, sample_rate)) * 0.5
+        noise = self.white_noise(len(t), 0.5)
         
         # Mix tone and noise
         waveform = tone + noise * 0.3
         
         # Apply envelope
-        envelope = np.exp(-5 * t)
-        waveform = waveform * envelope
-        
-        # Convert to 16-bit PCM
-        waveform = np.clip(waveform, -1, 1) * 32767
-        waveform = waveform.astype(np.int16)
+        envelope = _decay_envelope(len(t), 5, sample_rate)
+        waveform *= envelope
         
-        # Duplicate mono to match channel count (stereo)
-        if self.num_channels > 1:
-            waveform = np.column_stack([waveform] * self.num_channels)
-        else:
-            waveform = waveform.reshape(-1, 1)
+        # Convert to 16-bit PCM, written straight to every channel (stereo)
+        waveform = _to_pcm(waveform, self.num_channels)
         
         # Create and return PyGame sound
         sound = pygame.sndarray.make_sound(waveform)
@@ -182,28 +251,22 @@ class SoundGenerator:
         # Create an eerie UFO sound
         sample_rate = 44100
         duration = 3.0  # seconds (loopable)
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = _time_axis(sample_rate, duration)
         
         # Oscillating frequency between two values
         freq1 = 600
         freq2 = 800
         osc_rate = 4  # Hz
-        freq = freq1 + (freq2 - freq1) * 0.5 * (1 + np.sin(2 * np.pi * osc_rate * t))
+        freq = freq1 + (freq2 - freq1) * 0.5 * (1 + _sine(osc_rate * t))
         
         # Generate waveform - mix of sine waves
-        wave1 = np.sin(2 * np.pi * freq * t) * 0.3
-        wave2 = np.sin(2 * np.pi * (freq * 1.5) * t) * 0.15
+        phase = _sweep_phase(freq, sample_rate)  # Whole cycles over the loop, so it repeats without a click
+        wave1 = _sine(phase) * 0.3
+        wave2 = _sine(phase * 1.5) * 0.15
         waveform = wave1 + wave2
         
-        # Convert to 16-bit PCM
-        waveform = np.clip(waveform, -1, 1) * 32767
-        waveform = waveform.astype(np.int16)
-        
-        # Duplicate mono to match channel count (stereo)
-        if self.num_channels > 1:
-            waveform = np.column_stack([waveform] * self.num_channels)
-        else:
-            waveform = waveform.reshape(-1, 1)
+        # Convert to 16-bit PCM, written straight to every channel (stereo)
+        waveform = _to_pcm(waveform, self.num_channels)
         
         # Create and return PyGame sound
         sound = pygame.sndarray.make_sound(waveform)
@@ -214,41 +277,34 @@ class SoundGenerator:
         # Create a special explosion for the mystery ship
         sample_rate = 44100
         duration = 0.8  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = _time_axis(sample_rate, duration)
         
         # Complex frequency pattern
         base_freq = 500
-        freq_pattern = base_freq * (1 + 0.5 * np.sin(2 * np.pi * 10 * t))
+        freq_pattern = base_freq * (1 + 0.5 * _sine(10 * t))
         
         # Create a sweep
-        sweep = np.sin(2 * np.pi * freq_pattern * t)
+        sweep = _sine(_sweep_phase(freq_pattern, sample_rate))
         
         # Add noise burst
-        noise = np.random.uniform(-0.8, 0.8, size=len(t))
-        decay = np.exp(-5 * t)
+        noise = self.white_noise(len(t), 0.8)
+        decay = _decay_envelope(len(t), 5, sample_rate)
         noise = noise * decay
         
         # Combine and add beeping for "points"
         beep_freq = 1200
-        beep = np.sin(2 * np.pi * beep_freq * t)
-        beep_env = 0.5 * (1 + np.sin(2 * np.pi * 20 * t))
+        beep = _sine(beep_freq * t)
+        beep_env = 0.5 * (1 + _sine(20 * t))
         beep = beep * beep_env
         
         waveform = sweep * 0.3 + noise * 0.3 + beep * 0.4
         
         # Apply overall envelope
-        envelope = np.exp(-3 * t)
-        waveform = waveform * envelope
-        
-        # Convert to 16-bit PCM
-        waveform = np.clip(waveform, -1, 1) * 32767
-        waveform = waveform.astype(np.int16)
+        envelope = _decay_envelope(len(t), 3, sample_rate)
+        waveform *= envelope
         
-        # Duplicate mono to match channel count (stereo)
-        if self.num_channels > 1:
-            waveform = np.column_stack([waveform] * self.num_channels)
-        else:
-            waveform = waveform.reshape(-1, 1)
+        # Convert to 16-bit PCM, written straight to every channel (stereo)
+        waveform = _to_pcm(waveform, self.num_channels)
         
         # Create and return PyGame sound
         sound = pygame.sndarray.make_sound(waveform)
@@ -259,73 +315,43 @@ class SoundGenerator:
         # Create a descending "sad" game over sound
         sample_rate = 44100
         duration = 1.5  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = _time_axis(sample_rate, duration)
         
-        # Descending notes
-        notes = [400, 350, 300, 250, 200, 150]
+        # Descending notes, one pass over every sample
+        notes = np.array([400, 350, 300, 250, 200, 150], np.float32)
         note_duration = duration / len(notes)
         
-        waveform = np.zeros_like(t)
-        for i, note in enumerate(notes):
-            start_idx = int(i * note_duration * sample_rate)
-            end_idx = int((i + 1) * note_duration * sample_rate)
-            if end_idx > len(t):
-                end_idx = len(t)
-                
-            t_note = np.linspace(0, note_duration, end_idx - start_idx, False)
-            note_wave = np.sin(2 * np.pi * note * t_note)
-            
-            # Apply envelope to each note
-            env = np.exp(-3 * t_note / note_duration)
-            note_wave = note_wave * env
-            
-            waveform[start_idx:end_idx] = note_wave * 0.7
-        
-        # Convert to 16-bit PCM
-        waveform = np.clip(waveform, -1, 1) * 32767
-        waveform = waveform.astype(np.int16)
-        
-        # Duplicate mono to match channel count (stereo)
-        if self.num_channels > 1:
-            waveform = np.column_stack([waveform] * self.num_channels)
-        else:
-            waveform = waveform.reshape(-1, 1)
+        # Map each sample to its note and the time since that note started
+        note_starts = np.arange(len(notes), dtype=np.float32) * np.float32(note_duration)
+        note_idx = np.minimum((t / note_duration).astype(np.int32), len(notes) - 1)
+        t_local = t - note_starts[note_idx]  # Indexing keeps float32; int32 * float32 would promote to float64
+        
+        # Each note decays from the moment it starts
+        waveform = _sine(notes[note_idx] * t_local)
+        waveform *= np.exp(t_local * np.float32(-3 / note_duration))
+        waveform *= 0.7
+        
+        # Convert to 16-bit PCM, written straight to every channel (stereo)
+        waveform = _to_pcm(waveform, self.num_channels)
         
         # Create and return PyGame sound
         sound = pygame.sndarray.make_sound(waveform)
         return sound
     
     def generate_invader_movement_sounds(self):
-        """Generate the four different invader movement sounds"""
-        # Create the classic "step" sounds that cycle during gameplay
+        """Generate the invader movement sound"""
+        # Create the classic "step" sound played as the invaders move
         sample_rate = 44100
         duration = 0.1  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        
-        # We'll create 4 variations of the sound
-        base_freqs = [160, 180, 140, 120]
-        sound_array = []
-        
-        for base_freq in base_freqs:
-            # Simple sine wave with slight pitch shift
-            waveform = np.sin(2 * np.pi * base_freq * t)
-            
-            # Apply quick decay
-            envelope = np.exp(-20 * t)
-            waveform = waveform * envelope * 0.8
-            
-            # Convert to 16-bit PCM
-            waveform = np.clip(waveform, -1, 1) * 32767
-            waveform = waveform.astype(np.int16)
-            
-            # Duplicate mono to match channel count (stereo)
-            if self.num_channels > 1:
-                waveform = np.column_stack([waveform] * self.num_channels)
-            else:
-                waveform = waveform.reshape(-1, 1)
-            
-            # Create PyGame sound
-            sound = pygame.sndarray.make_sound(waveform)
-            sound_array.append(sound)
+        num_samples = int(sample_rate * duration)
+        base_freq = 160
         
-        return sound_array[0]  # We'll handle cycling in the game loop
\ No newline at end of file
+        # Simple sine wave with a quick decay
+        waveform = _decaying_sweep(np.full(num_samples, base_freq, np.float32), 20.0, 0.8, sample_rate)
+        
+        # Convert to 16-bit PCM, written straight to every channel (stereo)
+        waveform = _to_pcm(waveform, self.num_channels)
+        
+        # Create and return PyGame sound
+        sound = pygame.sndarray.make_sound(waveform)
+        return sound
\ No newline at end of file